@@ -37,7 +37,8 @@ class FileBackend(BaseBackend):
         # Use hash for very long keys
         if len(key_str) > 200:
             from pycaching.utils.key_generation import hash_key
-            key_str = hash_key(key_str)
+            # Pinned so file names stay stable if the default algorithm changes
+            key_str = hash_key(key_str, algorithm="sha256")
         return self.cache_dir / f"{key_str}.cache"
 
     def _get_impl(self, key: CacheKey) -> Optional[CacheValue]:
@@ -1,5 +1,6 @@
 """Async cache manager implementation."""
 
+import inspect
 from typing import Any, AsyncIterator, Optional
 
 from pycaching.core.backend import AsyncBackend
@@ -77,8 +78,15 @@ class AsyncCacheManager:
         return ":".join(parts)
 
     async def close(self) -> None:
-        """Close the cache manager and backend."""
-        await self.backend.close()
+        """Close the cache manager, backend and strategy."""
+        try:
+            if hasattr(self.strategy, "close"):
+                # Async wrappers return a coroutine; plain strategies close synchronously
+                result = self.strategy.close()
+                if inspect.isawaitable(result):
+                    await result
+        finally:
+            await self.backend.close()
 
     async def __aenter__(self) -> "AsyncCacheManager":
         """Async context manager entry."""
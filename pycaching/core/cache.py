@@ -24,6 +24,9 @@ class CacheManager:
         self.strategy = strategy
         self.config = config or CacheConfig()
         self._lock = Lock()
+        # Validate the backend once up front rather than on every operation
+        if hasattr(strategy, "bind"):
+            strategy.bind(backend)
 
     def get(
         self,
@@ -86,9 +89,14 @@ class CacheManager:
         return ":".join(parts)
 
     def close(self) -> None:
-        """Close the cache manager and backend."""
+        """Close the cache manager, strategy and backend."""
         with self._lock:
-            self.backend.close()
+            try:
+                # Let strategies with background work (write-back) flush first
+                if hasattr(self.strategy, "close"):
+                    self.strategy.close()
+            finally:
+                self.backend.close()
 
     def __enter__(self) -> "CacheManager":
         """Context manager entry."""
@@ -73,9 +73,20 @@ class AsyncStrategy(Protocol):
 class BaseStrategy(ABC):
     """Base class for strategy implementations."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str = "base"):
         self.name = name
 
+    def bind(self, backend: Backend) -> None:
+        """
+        Validate the backend this strategy will be used with.
+
+        Called once when a cache manager is created, so per-operation methods
+        do not need to re-check the backend on every call.
+        """
+        self._validate_backend(backend)
+
     @abstractmethod
     def get(
         self,
@@ -0,0 +1,29 @@
+"""Numba-compiled cosine similarity kernels for the semantic cache fallback path."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def cosine_matrix(matrix: np.ndarray, query: np.ndarray, out: np.ndarray) -> None:
+        """Write the cosine similarity of each matrix row against query into out."""
+        query_norm = 0.0
+        for j in range(query.shape[0]):
+            query_norm += query[j] * query[j]
+        for i in prange(matrix.shape[0]):
+            dot = 0.0
+            row_norm = 0.0
+            for j in range(matrix.shape[1]):
+                x = np.float32(matrix[i, j])
+                dot += x * query[j]
+                row_norm += x * x
+            denom = np.sqrt(row_norm * query_norm)
+            out[i] = dot / denom if denom > 0.0 else 0.0
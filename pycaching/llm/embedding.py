@@ -1,10 +1,67 @@
 """Embedding generation and semantic similarity calculation for LLM caching."""
 
 from typing import Any, Callable, Dict, List, Optional, Protocol, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+import hashlib
+import importlib
+import json
+import os
+import tempfile
 import numpy as np
 
 from pycaching.core.exceptions import CacheError
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+_OPTIONAL_MODULES: Dict[str, Any] = {}
+
+# Process-wide embedding memo shared by every EmbeddingGenerator, keyed by
+# (provider namespace..., text digest)
+_GLOBAL_EMBED_CACHE: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_GLOBAL_EMBED_LOCK = RLock()
+_GLOBAL_MAX = 2048
+
+
+def _import_optional(module_name: str, error_message: str) -> Any:
+    """
+    Import an optional provider dependency once and reuse the module afterwards.
+
+    Heavy ML dependencies are resolved on first use rather than at package import,
+    so importing pycaching.llm does not pull in torch or cloud SDKs.
+    """
+    module = _OPTIONAL_MODULES.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            raise ImportError(error_message)
+        _OPTIONAL_MODULES[module_name] = module
+    return module
+
+
+def _stack_embeddings(embeddings: List[List[float]]) -> np.ndarray:
+    """Copy per-text embedding lists row by row into a preallocated float32 array."""
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+    result = np.empty((len(embeddings), len(embeddings[0])), dtype=np.float32)
+    for i, embedding in enumerate(embeddings):
+        result[i] = embedding
+    return result
+
+
+def _text_digest(text: str) -> int:
+    """Hash text to a 64-bit integer for use as an embedding cache key."""
+    data = text.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
 
 class EmbeddingProvider(Protocol):
     """Protocol for embedding providers."""
@@ -25,6 +82,7 @@ class EmbeddingGenerator:
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
         custom_provider: Optional[Callable[[Union[str, List[str]]], np.ndarray]] = None,
+        enable_embedding_cache: bool = True,
         **kwargs: Any,
     ):
         """
@@ -37,9 +95,14 @@ class EmbeddingGenerator:
             api_key: API key for cloud providers
             api_base: API base URL (for Azure OpenAI or Ollama)
             custom_provider: Custom provider function (for 'custom' provider)
+            enable_embedding_cache: Whether to memoize embeddings of exact-duplicate texts
+                in the process-wide cache shared by all generators
             **kwargs: Additional provider-specific arguments
                 - For Ollama: base_url (default: http://localhost:11434)
-                - For HuggingFace: trust_remote_code, etc.
+                - For HuggingFace: backend ('torch', 'onnx' or 'openvino'), quantize
+                  (int8 dynamic quantization for 'onnx'), num_threads, etc.
+                - For AWS: region (default: us-east-1), max_workers for concurrent
+                  batch requests (default: 8)
         """
         self.provider_type = provider.lower()
         self.model_name = model_name
@@ -48,7 +111,39 @@ class EmbeddingGenerator:
         self.api_base = api_base
         self.custom_provider = custom_provider
         self.kwargs = kwargs
+        self.enable_embedding_cache = enable_embedding_cache
         self._provider = None
+        # Generators with the same namespace produce identical embeddings and share entries
+        self._cache_namespace = (
+            self.provider_type,
+            model_name,
+            api_base,
+            custom_provider,
+            kwargs.get("backend"),
+            bool(kwargs.get("quantize")),
+        )
+
+    @classmethod
+    def set_global_cache_size(cls, size: int) -> None:
+        """
+        Set the maximum number of embeddings kept in the shared embedding cache.
+
+        Args:
+            size: Maximum number of memoized embeddings (LRU eviction)
+        """
+        global _GLOBAL_MAX
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        with _GLOBAL_EMBED_LOCK:
+            _GLOBAL_MAX = size
+            while len(_GLOBAL_EMBED_CACHE) > _GLOBAL_MAX:
+                _GLOBAL_EMBED_CACHE.popitem(last=False)
+
+    @classmethod
+    def clear_global_cache(cls) -> None:
+        """Remove all embeddings from the shared embedding cache."""
+        with _GLOBAL_EMBED_LOCK:
+            _GLOBAL_EMBED_CACHE.clear()
 
     def _load_provider(self) -> EmbeddingProvider:
         """Lazy load the embedding provider."""
@@ -78,34 +173,129 @@ class EmbeddingGenerator:
     def _create_huggingface_provider(self) -> EmbeddingProvider:
         """Create HuggingFace sentence-transformers provider."""
         model_name = self.model_name or "sentence-transformers/all-MiniLM-L6-v2"
-        try:
-            from sentence_transformers import SentenceTransformer
+        backend = self.kwargs.get("backend", "torch").lower()
+        num_threads = self.kwargs.get("num_threads")
 
-            model = SentenceTransformer(model_name, device=self.device)
-            
-            class HuggingFaceProvider:
-                def __init__(self, model):
-                    self.model = model
-                
-                def generate(self, text: Union[str, List[str]]) -> np.ndarray:
-                    return self.model.encode(text, convert_to_numpy=True)
+        if backend == "onnx":
+            return self._create_huggingface_onnx_provider(model_name)
+        if backend not in ("torch", "openvino"):
+            raise ValueError(
+                f"Unknown HuggingFace backend: {backend}. Supported: torch, onnx, openvino"
+            )
+
+        sentence_transformers = _import_optional(
+            "sentence_transformers",
+            "sentence-transformers is required for HuggingFace provider. "
+            "Install with: pip install sentence-transformers",
+        )
+
+        if num_threads is not None:
+            # Caps intra-op parallelism; oversubscribed CPUs are a common slowdown
+            torch = _import_optional("torch", "torch is required to set num_threads")
+            torch.set_num_threads(num_threads)
+
+        if backend == "openvino":
+            model = sentence_transformers.SentenceTransformer(
+                model_name, device=self.device, backend="openvino"
+            )
+        else:
+            model = sentence_transformers.SentenceTransformer(model_name, device=self.device)
+        
+        class HuggingFaceProvider:
+            def __init__(self, model):
+                self.model = model
             
-            return HuggingFaceProvider(model)
-        except ImportError:
-            raise ImportError(
-                "sentence-transformers is required for HuggingFace provider. "
-                "Install with: pip install sentence-transformers"
+            def generate(self, text: Union[str, List[str]]) -> np.ndarray:
+                return self.model.encode(text, convert_to_numpy=True)
+        
+        return HuggingFaceProvider(model)
+
+    def _create_huggingface_onnx_provider(self, model_name: str) -> EmbeddingProvider:
+        """Create HuggingFace provider running the model through ONNX Runtime."""
+        error_message = (
+            "optimum[onnxruntime] is required for the HuggingFace ONNX backend. "
+            "Install with: pip install optimum[onnxruntime]"
+        )
+        onnxruntime = _import_optional("onnxruntime", error_message)
+        optimum_ort = _import_optional("optimum.onnxruntime", error_message)
+        transformers = _import_optional("transformers", error_message)
+
+        if self.device and self.device.startswith("cuda"):
+            execution_provider = "CUDAExecutionProvider"
+        else:
+            execution_provider = "CPUExecutionProvider"
+
+        session_options = onnxruntime.SessionOptions()
+        num_threads = self.kwargs.get("num_threads")
+        if num_threads is not None:
+            session_options.intra_op_num_threads = num_threads
+
+        model = optimum_ort.ORTModelForFeatureExtraction.from_pretrained(
+            model_name,
+            export=True,
+            provider=execution_provider,
+            session_options=session_options,
+        )
+
+        model_dir = None
+        if self.kwargs.get("quantize", False):
+            # Dynamic int8 quantization of the exported graph
+            ort_configuration = _import_optional("optimum.onnxruntime.configuration", error_message)
+
+            # Owned by the provider and removed on close() (or when garbage collected)
+            model_dir = tempfile.TemporaryDirectory(prefix="pycaching-onnx-")
+            save_dir = model_dir.name
+            quantizer = optimum_ort.ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=ort_configuration.AutoQuantizationConfig.avx2(
+                    is_static=False
+                ),
             )
+            model = optimum_ort.ORTModelForFeatureExtraction.from_pretrained(
+                save_dir,
+                file_name="model_quantized.onnx",
+                provider=execution_provider,
+                session_options=session_options,
+            )
+
+        tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+
+        class HuggingFaceONNXProvider:
+            def __init__(self, model, tokenizer, model_dir):
+                self.model = model
+                self.tokenizer = tokenizer
+                self.model_dir = model_dir
+
+            def close(self) -> None:
+                if self.model_dir is not None:
+                    self.model_dir.cleanup()
+                    self.model_dir = None
+
+            def generate(self, text: Union[str, List[str]]) -> np.ndarray:
+                texts = [text] if isinstance(text, str) else text
+                inputs = self.tokenizer(
+                    texts, padding=True, truncation=True, return_tensors="np"
+                )
+                outputs = self.model(**inputs)
+
+                # Mean pooling over non-padding tokens
+                hidden = np.asarray(outputs.last_hidden_state, dtype=np.float32)
+                mask = inputs["attention_mask"][..., None].astype(np.float32)
+                result = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+                return result[0] if isinstance(text, str) else result
+
+        return HuggingFaceONNXProvider(model, tokenizer, model_dir)
 
     def _create_ollama_provider(self) -> EmbeddingProvider:
         """Create Ollama embeddings provider (on-premise/local)."""
         model_name = self.model_name or "nomic-embed-text"
         base_url = self.api_base or self.kwargs.get("base_url", "http://localhost:11434")
         
-        try:
-            import requests
-        except ImportError:
-            raise ImportError("requests is required for Ollama provider. Install with: pip install requests")
+        requests = _import_optional(
+            "requests",
+            "requests is required for Ollama provider. Install with: pip install requests",
+        )
         
         class OllamaProvider:
             def __init__(self, model_name: str, base_url: str):
@@ -114,22 +304,22 @@ class EmbeddingGenerator:
             
             def generate(self, text: Union[str, List[str]]) -> np.ndarray:
                 texts = [text] if isinstance(text, str) else text
-                embeddings = []
-                
-                for txt in texts:
-                    response = requests.post(
-                        f"{self.base_url}/api/embeddings",
-                        json={
-                            "model": self.model_name,
-                            "prompt": txt,
-                        },
-                        timeout=30,
+                # /api/embed accepts the whole batch in a single request
+                response = requests.post(
+                    f"{self.base_url}/api/embed",
+                    json={
+                        "model": self.model_name,
+                        "input": texts,
+                    },
+                    timeout=30,
+                )
+                response.raise_for_status()
+                embeddings = response.json().get("embeddings")
+                if not embeddings and texts:
+                    raise RuntimeError(
+                        f"Ollama /api/embed response has no embeddings: {response.text}"
                     )
-                    response.raise_for_status()
-                    result = response.json()
-                    embeddings.append(result.get("embedding", []))
-                
-                result = np.array(embeddings, dtype=np.float32)
+                result = np.asarray(embeddings or [], dtype=np.float32)
                 return result[0] if isinstance(text, str) else result
         
         return OllamaProvider(model_name, base_url)
@@ -140,15 +330,13 @@ class EmbeddingGenerator:
         api_key = self.api_key
         
         if not api_key:
-            import os
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OpenAI API key is required. Provide api_key or set OPENAI_API_KEY env var.")
 
-        try:
-            import openai
-        except ImportError:
-            raise ImportError("openai is required for OpenAI provider. Install with: pip install openai")
+        openai = _import_optional(
+            "openai", "openai is required for OpenAI provider. Install with: pip install openai"
+        )
 
         client = openai.OpenAI(api_key=api_key, **self.kwargs)
         
@@ -163,8 +351,7 @@ class EmbeddingGenerator:
                     model=self.model_name,
                     input=texts,
                 )
-                embeddings = [item.embedding for item in response.data]
-                result = np.array(embeddings)
+                result = _stack_embeddings([item.embedding for item in response.data])
                 return result[0] if isinstance(text, str) else result
         
         return OpenAIProvider(client, model_name)
@@ -176,21 +363,18 @@ class EmbeddingGenerator:
         api_base = self.api_base
         
         if not api_key:
-            import os
             api_key = os.getenv("AZURE_OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("Azure OpenAI API key is required. Provide api_key or set AZURE_OPENAI_API_KEY env var.")
         
         if not api_base:
-            import os
             api_base = os.getenv("AZURE_OPENAI_ENDPOINT")
             if not api_base:
                 raise ValueError("Azure OpenAI endpoint is required. Provide api_base or set AZURE_OPENAI_ENDPOINT env var.")
 
-        try:
-            import openai
-        except ImportError:
-            raise ImportError("openai is required for Azure provider. Install with: pip install openai")
+        openai = _import_optional(
+            "openai", "openai is required for Azure provider. Install with: pip install openai"
+        )
 
         client = openai.AzureOpenAI(
             api_key=api_key,
@@ -209,8 +393,7 @@ class EmbeddingGenerator:
                     model=self.model_name,
                     input=texts,
                 )
-                embeddings = [item.embedding for item in response.data]
-                result = np.array(embeddings)
+                result = _stack_embeddings([item.embedding for item in response.data])
                 return result[0] if isinstance(text, str) else result
         
         return AzureProvider(client, model_name)
@@ -219,43 +402,54 @@ class EmbeddingGenerator:
         """Create AWS Bedrock embeddings provider."""
         model_name = self.model_name or "amazon.titan-embed-text-v1"
         region = self.kwargs.get("region", "us-east-1")
+        # Bedrock embeds one text per call, so batches are fanned out over a thread pool
+        max_workers = self.kwargs.get("max_workers", 8)
         
-        try:
-            import boto3
-        except ImportError:
-            raise ImportError("boto3 is required for AWS provider. Install with: pip install boto3")
+        boto3 = _import_optional(
+            "boto3", "boto3 is required for AWS provider. Install with: pip install boto3"
+        )
 
         bedrock_runtime = boto3.client(
             "bedrock-runtime",
             region_name=region,
-            **{k: v for k, v in self.kwargs.items() if k != "region"},
+            **{k: v for k, v in self.kwargs.items() if k not in ("region", "max_workers")},
         )
         
         class AWSProvider:
-            def __init__(self, client, model_name):
+            def __init__(self, client, model_name, max_workers):
                 self.client = client
                 self.model_name = model_name
+                self._pool = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="pycaching-bedrock"
+                )
+            
+            def _embed_one(self, txt: str) -> List[float]:
+                response = self.client.invoke_model(
+                    modelId=self.model_name,
+                    body=json.dumps({"inputText": txt}),
+                    contentType="application/json",
+                    accept="application/json",
+                )
+                result = json.loads(response["body"].read())
+                return result.get("embedding", [])
             
             def generate(self, text: Union[str, List[str]]) -> np.ndarray:
-                texts = [text] if isinstance(text, str) else text
-                embeddings = []
+                if isinstance(text, str):
+                    return np.asarray(self._embed_one(text), dtype=np.float32)
                 
-                for txt in texts:
-                    import json
-                    body = json.dumps({"inputText": txt})
-                    response = self.client.invoke_model(
-                        modelId=self.model_name,
-                        body=body,
-                        contentType="application/json",
-                        accept="application/json",
-                    )
-                    result = json.loads(response["body"].read())
-                    embeddings.append(result.get("embedding", []))
+                futures = [self._pool.submit(self._embed_one, txt) for txt in text]
+                result = None
+                for i, future in enumerate(futures):
+                    embedding = future.result()
+                    if result is None:
+                        result = np.empty((len(futures), len(embedding)), dtype=np.float32)
+                    result[i] = embedding
                 
-                result = np.array(embeddings)
-                return result[0] if isinstance(text, str) else result
+                if result is None:
+                    return np.empty((0, 0), dtype=np.float32)
+                return result
         
-        return AWSProvider(bedrock_runtime, model_name)
+        return AWSProvider(bedrock_runtime, model_name, max_workers)
 
     def _create_custom_provider(self) -> EmbeddingProvider:
         """Create custom provider from function."""
@@ -282,10 +476,69 @@ class EmbeddingGenerator:
             text: Single text string or list of text strings
 
         Returns:
-            Numpy array of embeddings (1D for single text, 2D for list)
+            Numpy array of embeddings (1D for single text, 2D for list). Memoized
+            embeddings are shared process-wide, so the result is always a new array
+            the caller may modify
         """
         provider = self._load_provider()
-        return provider.generate(text)
+        if not self.enable_embedding_cache:
+            return provider.generate(text)
+
+        if isinstance(text, str):
+            key = self._cache_namespace + (_text_digest(text),)
+            embedding = self._cache_get(key)
+            if embedding is None:
+                embedding = self._cache_put(key, provider.generate(text))
+            # The memoized array is shared and read-only; callers get their own copy
+            return embedding.copy()
+
+        if not text:
+            return np.ascontiguousarray(provider.generate(text), dtype=np.float32)
+
+        # Only send distinct texts that are not memoized to the provider
+        keys = [self._cache_namespace + (_text_digest(txt),) for txt in text]
+        embeddings = [self._cache_get(key) for key in keys]
+        pending: Dict[tuple, List[int]] = {}
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                pending.setdefault(keys[i], []).append(i)
+        if pending:
+            groups = list(pending.values())
+            generated = provider.generate([text[group[0]] for group in groups])
+            for group, embedding in zip(groups, generated):
+                embedding = self._cache_put(keys[group[0]], embedding)
+                for i in group:
+                    embeddings[i] = embedding
+
+        # np.stack copies, so the result never aliases the memoized arrays
+        return np.stack(embeddings)
+
+    @staticmethod
+    def _cache_get(key: tuple) -> Optional[np.ndarray]:
+        """Look up a memoized embedding, marking it as recently used."""
+        with _GLOBAL_EMBED_LOCK:
+            embedding = _GLOBAL_EMBED_CACHE.get(key)
+            if embedding is not None:
+                _GLOBAL_EMBED_CACHE.move_to_end(key)
+            return embedding
+
+    @staticmethod
+    def _cache_put(key: tuple, embedding: np.ndarray) -> np.ndarray:
+        """Memoize an embedding as a read-only float32 array and return it."""
+        embedding = np.array(embedding, dtype=np.float32)
+        embedding.flags.writeable = False
+        with _GLOBAL_EMBED_LOCK:
+            _GLOBAL_EMBED_CACHE[key] = embedding
+            _GLOBAL_EMBED_CACHE.move_to_end(key)
+            while len(_GLOBAL_EMBED_CACHE) > _GLOBAL_MAX:
+                _GLOBAL_EMBED_CACHE.popitem(last=False)
+        return embedding
+
+    def close(self) -> None:
+        """Release the provider and any files it created (e.g. a quantized ONNX model)."""
+        provider, self._provider = self._provider, None
+        if provider is not None and hasattr(provider, "close"):
+            provider.close()
 
     def generate_single(self, text: str) -> np.ndarray:
         """
@@ -303,6 +556,40 @@ class EmbeddingGenerator:
 class SimilarityCalculator:
     """Calculate semantic similarity between embeddings."""
 
+    @staticmethod
+    def normalize(embedding: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize an embedding (or each row of a 2D array of embeddings).
+
+        Normalized embeddings let cosine similarity be computed as a plain dot
+        product, so stored vectors only need to be normalized once.
+
+        Args:
+            embedding: Embedding vector or 2D array of embedding vectors
+
+        Returns:
+            Contiguous float32 array of unit-length embeddings
+        """
+        embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+        norms = np.linalg.norm(embedding, axis=-1, keepdims=True)
+        return embedding / (norms + 1e-12)
+
+    @staticmethod
+    def cosine_similarity_normalized(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+        """
+        Calculate cosine similarity between two L2-normalized embeddings.
+
+        Args:
+            embedding1: First embedding vector (unit length)
+            embedding2: Second embedding vector (unit length)
+
+        Returns:
+            Cosine similarity score between -1 and 1
+        """
+        embedding1 = np.ascontiguousarray(embedding1, dtype=np.float32)
+        embedding2 = np.ascontiguousarray(embedding2, dtype=np.float32)
+        return float(embedding1 @ embedding2)
+
     @staticmethod
     def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """
@@ -315,16 +602,43 @@ class SimilarityCalculator:
         Returns:
             Cosine similarity score between -1 and 1
         """
-        # Normalize vectors
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+        # vdot avoids the generic dispatch overhead of np.linalg.norm
+        norm_product = np.sqrt(np.vdot(embedding1, embedding1) * np.vdot(embedding2, embedding2))
 
-        if norm1 == 0 or norm2 == 0:
+        if norm_product == 0:
             return 0.0
 
         # Calculate cosine similarity
         dot_product = np.dot(embedding1, embedding2)
-        return float(dot_product / (norm1 * norm2))
+        return float(dot_product / norm_product)
+
+    @staticmethod
+    def cosine_similarity_batch(
+        query: np.ndarray,
+        matrix: np.ndarray,
+        matrix_norms: Optional[np.ndarray] = None,
+        normalized: bool = False,
+    ) -> np.ndarray:
+        """
+        Calculate cosine similarity between a query and every row of a matrix.
+
+        Args:
+            query: Query embedding vector
+            matrix: 2D array with one candidate embedding per row
+            matrix_norms: Precomputed L2 norms of the matrix rows, to avoid
+                recomputing them on every call
+            normalized: Whether the query and rows are already L2-normalized,
+                in which case the result is a single matrix-vector product
+
+        Returns:
+            1D array of cosine similarity scores, one per row
+        """
+        if normalized:
+            return matrix @ query
+        query = query / (np.sqrt(np.vdot(query, query)) + 1e-12)
+        if matrix_norms is None:
+            matrix_norms = np.linalg.norm(matrix, axis=1)
+        return (matrix @ query) / (matrix_norms + 1e-12)
 
     @staticmethod
     def euclidean_distance(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
@@ -346,6 +660,7 @@ class SimilarityCalculator:
         embedding2: np.ndarray,
         method: str = "cosine",
         threshold: float = 0.8,
+        normalized: bool = False,
     ) -> tuple[float, bool]:
         """
         Calculate similarity score and determine if embeddings are similar.
@@ -355,11 +670,16 @@ class SimilarityCalculator:
             embedding2: Second embedding vector
             method: Similarity method ('cosine' or 'euclidean')
             threshold: Threshold for considering embeddings similar
+            normalized: Whether both embeddings are already L2-normalized, in which
+                case cosine similarity reduces to a dot product
 
         Returns:
             Tuple of (similarity_score, is_similar)
         """
-        if method == "cosine":
+        if method == "cosine" and normalized:
+            score = SimilarityCalculator.cosine_similarity_normalized(embedding1, embedding2)
+            is_similar = score >= threshold
+        elif method == "cosine":
             score = SimilarityCalculator.cosine_similarity(embedding1, embedding2)
             is_similar = score >= threshold
         elif method == "euclidean":
@@ -378,6 +698,7 @@ class SimilarityCalculator:
         candidate_embeddings: List[np.ndarray],
         method: str = "cosine",
         top_k: int = 1,
+        normalized: bool = False,
     ) -> List[tuple[int, float]]:
         """
         Find the most similar embeddings to a query embedding.
@@ -387,20 +708,51 @@ class SimilarityCalculator:
             candidate_embeddings: List of candidate embedding vectors
             method: Similarity method ('cosine' or 'euclidean')
             top_k: Number of top results to return
+            normalized: Whether the query and candidates are already L2-normalized,
+                in which case cosine similarity reduces to a dot product
 
         Returns:
             List of tuples (index, similarity_score) sorted by similarity
         """
-        similarities = []
-        for idx, candidate in enumerate(candidate_embeddings):
-            if method == "cosine":
-                score = SimilarityCalculator.cosine_similarity(query_embedding, candidate)
-            else:
-                distance = SimilarityCalculator.euclidean_distance(query_embedding, candidate)
-                score = 1.0 / (1.0 + distance)
-
-            similarities.append((idx, score))
-
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        if len(candidate_embeddings) == 0 or top_k <= 0:
+            return []
+
+        matrix = np.asarray(candidate_embeddings)
+        if method == "cosine" and normalized:
+            matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            query = np.ascontiguousarray(query_embedding, dtype=np.float32)
+            scores = SimilarityCalculator.cosine_similarity_batch(query, matrix, normalized=True)
+        elif method == "cosine":
+            scores = SimilarityCalculator.cosine_similarity_batch(query_embedding, matrix)
+        else:
+            distances = np.linalg.norm(matrix - query_embedding, axis=1)
+            scores = 1.0 / (1.0 + distances)
+
+        order = SimilarityCalculator.top_k_indices(scores, top_k)
+        return [(int(i), float(scores[i])) for i in order]
+
+    @staticmethod
+    def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Get the indices of the highest scores, sorted by descending score.
+
+        Uses partial selection so only the top_k entries are sorted.
+
+        Args:
+            scores: 1D array of similarity scores
+            top_k: Number of indices to return
+
+        Returns:
+            Array of at most top_k indices into scores
+        """
+        n = len(scores)
+        if top_k <= 0 or n == 0:
+            return np.empty(0, dtype=np.intp)
+        if top_k == 1:
+            # Single best match (the SemanticCache.get path) needs only one argmax pass
+            return np.array([np.argmax(scores)], dtype=np.intp)
+        if top_k < n:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(n)
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
@@ -1,6 +1,8 @@
 """Semantic similarity-based caching for LLM prompts."""
 
-from typing import Dict, List, Optional, Tuple
+import hashlib
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 import numpy as np
 
 from pycaching.backends.memory import MemoryBackend
@@ -8,6 +10,19 @@ from pycaching.core.backend import Backend
 from pycaching.core.types import CacheKey, CacheValue
 from pycaching.llm.embedding import EmbeddingGenerator, SimilarityCalculator
 
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+
+@lru_cache(maxsize=None)
+def _numba_cosine_matrix() -> Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], None]]:
+    """Load the numba int8 kernel on first use; importing numba takes ~200 ms."""
+    from pycaching.llm import _numba_cosine
+
+    return _numba_cosine.cosine_matrix if _numba_cosine.NUMBA_AVAILABLE else None
+
 
 class SemanticCache:
     """Cache that uses semantic similarity to find similar prompts."""
@@ -20,6 +35,8 @@ class SemanticCache:
         device: Optional[str] = None,
         similarity_threshold: float = 0.8,
         similarity_method: str = "cosine",
+        dtype: str = "float32",
+        index_type: str = "flat",
     ):
         """
         Initialize semantic cache.
@@ -31,6 +48,11 @@ class SemanticCache:
             device: Device to run the model on (cpu, cuda, etc.)
             similarity_threshold: Minimum similarity score to consider a match
             similarity_method: Similarity calculation method ('cosine' or 'euclidean')
+            dtype: Storage precision for cached embeddings ('float32', 'float16' or 'int8').
+                Lower precision shrinks memory per entry; 'int8' requires cosine similarity.
+            index_type: Nearest-neighbour search method. 'flat' scores every cached entry
+                exactly; 'hnsw' uses an approximate FAISS HNSW index for sub-linear lookups
+                on large caches (requires faiss).
         """
         self.backend = backend or MemoryBackend()
         
@@ -46,15 +68,215 @@ class SemanticCache:
         else:
             self.embedding_generator = embedding_generator
             
+        if similarity_method not in ("cosine", "euclidean"):
+            raise ValueError(f"Unknown similarity method: {similarity_method}")
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float16, np.int8):
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+        if self.dtype == np.int8 and similarity_method != "cosine":
+            raise ValueError("int8 embeddings require cosine similarity")
+        if index_type not in ("flat", "hnsw"):
+            raise ValueError(f"Unknown index type: {index_type}")
+        self.index_type = index_type
+        if index_type == "hnsw":
+            try:
+                import faiss
+                self._faiss = faiss
+            except ImportError:
+                raise ImportError(
+                    "faiss is required for the 'hnsw' index. Install with: pip install faiss-cpu"
+                )
+        # FAISS index whose ids match matrix rows; built lazily and rebuilt after rows move
+        self._index = None
+
         self.similarity_threshold = similarity_threshold
         self.similarity_method = similarity_method
-        self._embeddings: Dict[str, np.ndarray] = {}  # key -> embedding
+        # Cosine embeddings are stored unit length; euclidean distances need raw vectors
+        self._is_normalized = similarity_method == "cosine"
         self._prompts: Dict[str, str] = {}  # key -> original prompt
+        # Embeddings stacked row-wise so a lookup is a single matrix-vector product; the
+        # matrix, _keys and _key_to_row are the only record of cached embeddings. The
+        # buffers are over-allocated and grown by doubling, so only the first
+        # len(_keys) rows are live.
+        self._matrix: Optional[np.ndarray] = None
+        self._sqnorms: Optional[np.ndarray] = None  # row -> squared L2 norm
+        self._keys: List[str] = []  # row -> key
+        self._key_to_row: Dict[str, int] = {}
 
     def _generate_key(self, prompt: str) -> str:
         """Generate a cache key for a prompt."""
-        import hashlib
-        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        # An 8-byte BLAKE2b digest gives the same 16 hex chars without truncating a SHA-256
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        """Generate the embedding for a prompt, normalized once when using cosine similarity."""
+        embedding = self.embedding_generator.generate_single(prompt)
+        if self._is_normalized:
+            return SimilarityCalculator.normalize(embedding)
+        return np.ascontiguousarray(embedding, dtype=np.float32)
+
+    def _embed_many(self, prompts: List[str]) -> np.ndarray:
+        """Generate embeddings for several prompts in one batched model call."""
+        embeddings = np.asarray(self.embedding_generator.generate(prompts))
+        if self._is_normalized:
+            return SimilarityCalculator.normalize(embeddings)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def _quantize(self, embedding: np.ndarray) -> np.ndarray:
+        """Cast an embedding to the storage dtype (int8 rows hold round(x * 127))."""
+        if self.dtype == np.int8:
+            return np.round(embedding * 127).astype(np.int8)
+        return embedding.astype(self.dtype, copy=False)
+
+    def _reserve(self, size: int, rows: int, dim: int) -> None:
+        """Ensure the buffers hold at least rows rows, keeping the first size live rows."""
+        capacity = 0 if self._matrix is None else len(self._matrix)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 16)
+        matrix = np.empty((capacity, dim), dtype=self.dtype)
+        sqnorms = np.empty(capacity, dtype=np.float32)
+        if size:
+            matrix[:size] = self._matrix[:size]
+            sqnorms[:size] = self._sqnorms[:size]
+        self._matrix = matrix
+        self._sqnorms = sqnorms
+
+    def _add_embedding(self, key: str, embedding: np.ndarray) -> None:
+        """Store an embedding as a row of the similarity matrix."""
+        embedding = self._quantize(embedding)
+        stored = embedding.astype(np.float32)
+        sqnorm = np.vdot(stored, stored)
+        row = self._key_to_row.get(key)
+        if row is not None:
+            self._matrix[row] = embedding
+            self._sqnorms[row] = sqnorm
+            self._index = None
+        else:
+            row = len(self._keys)
+            self._reserve(row, row + 1, len(embedding))
+            self._matrix[row] = embedding
+            self._sqnorms[row] = sqnorm
+            self._key_to_row[key] = row
+            self._keys.append(key)
+
+            if self._index is not None and self._index.ntotal == row:
+                self._index.add(self._rows_as_float32(self._matrix[row : row + 1]))
+            else:
+                self._index = None
+
+    def _add_embeddings(self, keys: List[str], embeddings: np.ndarray) -> None:
+        """Store a batch of embeddings, appending all new keys as a single block."""
+        embeddings = self._quantize(embeddings)
+        stored = embeddings.astype(np.float32)
+        sqnorms = np.einsum("ij,ij->i", stored, stored)
+        old_size = len(self._keys)
+        new_rows: Dict[str, int] = {}  # new key -> batch position (last one wins)
+        for position, key in enumerate(keys):
+            row = self._key_to_row.get(key)
+            if row is not None and row < old_size:
+                self._matrix[row] = embeddings[position]
+                self._sqnorms[row] = sqnorms[position]
+                self._index = None
+            else:
+                if key not in new_rows:
+                    self._key_to_row[key] = old_size + len(new_rows)
+                    self._keys.append(key)
+                new_rows[key] = position
+        if not new_rows:
+            return
+
+        positions = list(new_rows.values())
+        block = embeddings[positions]
+        new_size = old_size + len(positions)
+        self._reserve(old_size, new_size, embeddings.shape[1])
+        self._matrix[old_size:new_size] = block
+        self._sqnorms[old_size:new_size] = sqnorms[positions]
+
+        if self._index is not None and self._index.ntotal == old_size:
+            self._index.add(self._rows_as_float32(block))
+        else:
+            self._index = None
+
+    def _remove_embedding(self, key: str) -> None:
+        """Remove an embedding row by swapping the last row into its place."""
+        row = self._key_to_row.pop(key, None)
+        if row is None:
+            return
+        last = len(self._keys) - 1
+        if row != last:
+            last_key = self._keys[last]
+            self._matrix[row] = self._matrix[last]
+            self._sqnorms[row] = self._sqnorms[last]
+            self._keys[row] = last_key
+            self._key_to_row[last_key] = row
+        self._keys.pop()
+        # HNSW indexes cannot remove vectors, so rebuild on the next lookup
+        self._index = None
+
+    def _rows_as_float32(self, rows: np.ndarray) -> np.ndarray:
+        """Convert stored matrix rows back to float32 for FAISS."""
+        if self.dtype == np.int8:
+            return np.ascontiguousarray(rows, dtype=np.float32) / 127.0
+        return np.ascontiguousarray(rows, dtype=np.float32)
+
+    def _search_index(
+        self, query_embedding: np.ndarray, top_k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search the FAISS HNSW index, building it from the matrix if needed."""
+        if self._index is None:
+            faiss = self._faiss
+            metric = faiss.METRIC_INNER_PRODUCT if self._is_normalized else faiss.METRIC_L2
+            self._index = faiss.IndexHNSWFlat(self._matrix.shape[1], 32, metric)
+            self._index.add(self._rows_as_float32(self._matrix[: len(self._keys)]))
+
+        query = np.ascontiguousarray(query_embedding, dtype=np.float32)[np.newaxis, :]
+        distances, rows = self._index.search(query, min(top_k, len(self._keys)))
+        found = rows[0] >= 0
+        rows, distances = rows[0][found], distances[0][found]
+        if self._is_normalized:
+            return rows, distances
+        # METRIC_L2 reports squared distances
+        return rows, 1.0 / (1.0 + np.sqrt(np.maximum(distances, 0.0)))
+
+    def _top_matches(
+        self, query_embedding: np.ndarray, top_k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the rows and scores of the top_k most similar cached embeddings."""
+        if self.index_type == "hnsw":
+            return self._search_index(query_embedding, top_k)
+        scores = self._scores(query_embedding)
+        rows = SimilarityCalculator.top_k_indices(scores, top_k)
+        return rows, scores[rows]
+
+    def _scores(self, query_embedding: np.ndarray) -> np.ndarray:
+        """Score the query against every cached embedding in one vectorized pass."""
+        size = len(self._keys)
+        matrix = self._matrix[:size]
+        if self._is_normalized:
+            if simsimd is not None:
+                # SIMD cosine kernels (AVX2/AVX-512/NEON) with native f16/i8 support
+                query = self._quantize(query_embedding)
+                distances = simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine")
+                return 1.0 - np.asarray(distances)[0]
+            # Rows and query are unit length, so cosine similarity is a dot product
+            if self.dtype == np.int8:
+                cosine_matrix = _numba_cosine_matrix()
+                if cosine_matrix is not None:
+                    # Fused kernel reads int8 rows directly instead of upcasting the matrix
+                    scores = np.empty(size, dtype=np.float32)
+                    cosine_matrix(matrix, query_embedding, scores)
+                    return scores
+                return (matrix @ query_embedding) / 127.0
+            return SimilarityCalculator.cosine_similarity_batch(
+                query_embedding, matrix, normalized=True
+            )
+        # ||q - c||^2 = ||q||^2 + ||c||^2 - 2 q.c with ||c||^2 cached per row
+        sq_distances = (
+            self._sqnorms[:size] - 2.0 * (matrix @ query_embedding)
+            + np.vdot(query_embedding, query_embedding)
+        )
+        return 1.0 / (1.0 + np.sqrt(np.maximum(sq_distances, 0.0)))
 
     def get(self, prompt: str) -> Optional[CacheValue]:
         """
@@ -66,35 +288,17 @@ class SemanticCache:
         Returns:
             Cached response if similar prompt found, None otherwise
         """
-        # Generate embedding for the query prompt
-        query_embedding = self.embedding_generator.generate_single(prompt)
-
-        # Find most similar cached prompt
-        if not self._embeddings:
+        if not self._keys:
             return None
 
-        # Calculate similarities
-        candidates = list(self._embeddings.items())
-        similarities = []
-        for key, cached_embedding in candidates:
-            score, is_similar = SimilarityCalculator.similarity_score(
-                query_embedding,
-                cached_embedding,
-                method=self.similarity_method,
-                threshold=self.similarity_threshold,
-            )
-            if is_similar:
-                similarities.append((key, score))
-
-        if not similarities:
+        # Find the most similar cached prompt
+        query_embedding = self._embed(prompt)
+        rows, scores = self._top_matches(query_embedding, 1)
+        if len(rows) == 0 or scores[0] < self.similarity_threshold:
             return None
 
-        # Get the most similar
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        best_key = similarities[0][0]
-
         # Return cached response
-        return self.backend.get(best_key)
+        return self.backend.get(self._keys[rows[0]])
 
     def set(self, prompt: str, response: CacheValue, ttl: Optional[float] = None) -> bool:
         """
@@ -111,23 +315,57 @@ class SemanticCache:
         key = self._generate_key(prompt)
 
         # Generate and store embedding
-        embedding = self.embedding_generator.generate_single(prompt)
-        self._embeddings[key] = embedding
+        embedding = self._embed(prompt)
+        self._add_embedding(key, embedding)
         self._prompts[key] = prompt
 
         # Store response in backend
         return self.backend.set(key, response, ttl)
 
+    def set_many(
+        self, items: List[Tuple[str, CacheValue]], ttl: Optional[float] = None
+    ) -> int:
+        """
+        Cache several prompt-response pairs.
+
+        Prompts are embedded in a single batch and appended to the similarity
+        matrix in one step, which is much faster than repeated set() calls.
+
+        Args:
+            items: List of (prompt, response) tuples
+            ttl: Optional time-to-live in seconds for all entries
+
+        Returns:
+            Number of successfully cached entries
+        """
+        if not items:
+            return 0
+
+        prompts = [prompt for prompt, _ in items]
+        keys = [self._generate_key(prompt) for prompt in prompts]
+        self._add_embeddings(keys, self._embed_many(prompts))
+
+        count = 0
+        for key, (prompt, response) in zip(keys, items):
+            self._prompts[key] = prompt
+            if self.backend.set(key, response, ttl):
+                count += 1
+        return count
+
     def delete(self, prompt: str) -> bool:
         """Delete a cached prompt-response pair."""
         key = self._generate_key(prompt)
-        self._embeddings.pop(key, None)
+        self._remove_embedding(key)
         self._prompts.pop(key, None)
         return self.backend.delete(key)
 
     def clear(self) -> bool:
         """Clear all cached entries."""
-        self._embeddings.clear()
+        self._matrix = None
+        self._sqnorms = None
+        self._keys.clear()
+        self._key_to_row.clear()
+        self._index = None
         self._prompts.clear()
         return self.backend.clear()
 
@@ -144,24 +382,17 @@ class SemanticCache:
         Returns:
             List of tuples (prompt, similarity_score, response)
         """
-        query_embedding = self.embedding_generator.generate_single(prompt)
-
-        if not self._embeddings:
+        if not self._keys:
             return []
 
-        # Calculate similarities for all cached prompts
-        similarities = []
-        for key, cached_embedding in self._embeddings.items():
-            score = SimilarityCalculator.cosine_similarity(query_embedding, cached_embedding)
-            similarities.append((key, score))
-
-        # Sort and get top k
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Select top k without sorting every score
+        query_embedding = self._embed(prompt)
+        rows, scores = self._top_matches(query_embedding, top_k)
         results = []
-
-        for key, score in similarities[:top_k]:
+        for row, score in zip(rows, scores):
+            key = self._keys[row]
             response = self.backend.get(key)
             original_prompt = self._prompts.get(key, "")
-            results.append((original_prompt, score, response))
+            results.append((original_prompt, float(score), response))
 
         return results
@@ -1,14 +1,27 @@
 """Token tracking for LLM cost optimization."""
 
-from typing import Dict, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional, Tuple
 from datetime import datetime
+import time
+
+# (timestamp, prompt_tokens, completion_tokens, total_tokens, cost, model)
+_HistoryEntry = Tuple[float, int, int, int, float, Optional[str]]
 
 
 class TokenTracker:
     """Track token usage and costs for LLM operations."""
 
-    def __init__(self):
-        """Initialize token tracker."""
+    def __init__(self, history_capacity: int = 10_000):
+        """
+        Initialize token tracker.
+
+        Args:
+            history_capacity: Maximum number of requests kept in history; the
+                oldest entries are dropped once it is full
+        """
+        self.history_capacity = history_capacity
         self.total_tokens: int = 0
         self.total_prompt_tokens: int = 0
         self.total_completion_tokens: int = 0
@@ -16,7 +29,10 @@ class TokenTracker:
         self.requests: int = 0
         self.cache_hits: int = 0
         self.cache_misses: int = 0
-        self._history: list[Dict] = []
+        # Running per-model aggregates, so stats never need to scan history
+        self._cost_per_model: Dict[str, float] = {}
+        self._tokens_per_model: Dict[str, int] = {}
+        self._history: Deque[_HistoryEntry] = deque(maxlen=history_capacity)
 
     def record_request(
         self,
@@ -49,19 +65,19 @@ class TokenTracker:
             total_tokens = prompt_tokens + completion_tokens
             cost = (total_tokens / 1000.0) * cost_per_1k_tokens
             self.total_cost += cost
+            if model is not None:
+                self._cost_per_model[model] = self._cost_per_model.get(model, 0.0) + cost
+                self._tokens_per_model[model] = (
+                    self._tokens_per_model.get(model, 0) + total_tokens
+                )
 
-            # Record in history
-            self._history.append({
-                "timestamp": datetime.now().isoformat(),
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": total_tokens,
-                "cost": cost,
-                "model": model,
-            })
+            # Record in history; timestamps are formatted only when read
+            self._history.append(
+                (time.time(), prompt_tokens, completion_tokens, total_tokens, cost, model)
+            )
 
     def get_stats(self) -> Dict[str, any]:
-        """Get token usage statistics."""
+        """Get token usage statistics from running aggregates (O(1) in history size)."""
         hit_rate = (
             self.cache_hits / self.requests if self.requests > 0 else 0.0
         )
@@ -80,13 +96,28 @@ class TokenTracker:
             "total_completion_tokens": self.total_completion_tokens,
             "total_cost": self.total_cost,
             "estimated_savings": estimated_savings,
+            "cost_per_model": dict(self._cost_per_model),
+            "tokens_per_model": dict(self._tokens_per_model),
         }
 
     def get_history(self, limit: Optional[int] = None) -> list[Dict]:
-        """Get request history."""
-        if limit is None:
-            return self._history.copy()
-        return self._history[-limit:]
+        """Get request history (the last limit entries, as history[-limit:] selects)."""
+        entries = self._history
+        if limit is not None:
+            # Same start as history[-limit:], so limit=0 still returns everything
+            start = slice(-limit, None).indices(len(entries))[0]
+            entries = islice(entries, start, None)
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": total_tokens,
+                "cost": cost,
+                "model": model,
+            }
+            for timestamp, prompt_tokens, completion_tokens, total_tokens, cost, model in entries
+        ]
 
     def reset(self) -> None:
         """Reset all statistics."""
@@ -97,4 +128,6 @@ class TokenTracker:
         self.requests = 0
         self.cache_hits = 0
         self.cache_misses = 0
+        self._cost_per_model.clear()
+        self._tokens_per_model.clear()
         self._history.clear()
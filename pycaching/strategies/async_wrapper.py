@@ -1,9 +1,12 @@
 """Async wrapper for sync strategies."""
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 import asyncio
+import os
 
 from pycaching.core.backend import AsyncBackend, Backend
+from pycaching.core.exceptions import StrategyError
 from pycaching.core.strategy import AsyncStrategy, Strategy
 from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 from pycaching.backends.async_wrapper import AsyncBackendWrapper
@@ -12,8 +15,21 @@ from pycaching.backends.async_wrapper import AsyncBackendWrapper
 class AsyncStrategyWrapper(AsyncStrategy):
     """Wrapper to make a sync strategy async."""
 
-    def __init__(self, strategy: Strategy):
+    def __init__(self, strategy: Strategy, max_workers: Optional[int] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            strategy: Sync strategy to run off the event loop
+            max_workers: Size of the wrapper's thread pool (defaults to the CPU count)
+        """
         self.strategy = strategy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Dedicated bounded pool instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pycache"
+        )
+        self._closed = False
 
     async def get(
         self,
@@ -22,6 +38,7 @@ class AsyncStrategyWrapper(AsyncStrategy):
         miss_callback: Optional[CacheMissCallback] = None,
     ) -> Optional[CacheValue]:
         """Get a value using the strategy."""
+        self._check_closed()
         # If backend is a wrapper, unwrap it
         if isinstance(backend, AsyncBackendWrapper):
             sync_backend = backend.backend
@@ -29,9 +46,9 @@ class AsyncStrategyWrapper(AsyncStrategy):
             # For native async backends, we need to call async methods
             return await backend.get(key)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self.strategy.get, sync_backend, key, miss_callback
+            self._executor, self.strategy.get, sync_backend, key, miss_callback
         )
 
     async def set(
@@ -42,32 +59,63 @@ class AsyncStrategyWrapper(AsyncStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value using the strategy."""
+        self._check_closed()
         if isinstance(backend, AsyncBackendWrapper):
             sync_backend = backend.backend
         else:
             return await backend.set(key, value, ttl)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self.strategy.set, sync_backend, key, value, ttl
+            self._executor, self.strategy.set, sync_backend, key, value, ttl
         )
 
     async def delete(self, backend: AsyncBackend, key: CacheKey) -> bool:
         """Delete a value using the strategy."""
+        self._check_closed()
         if isinstance(backend, AsyncBackendWrapper):
             sync_backend = backend.backend
         else:
             return await backend.delete(key)
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.strategy.delete, sync_backend, key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.strategy.delete, sync_backend, key
+        )
 
     async def clear(self, backend: AsyncBackend) -> bool:
         """Clear the cache using the strategy."""
+        self._check_closed()
         if isinstance(backend, AsyncBackendWrapper):
             sync_backend = backend.backend
         else:
             return await backend.clear()
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.strategy.clear, sync_backend)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.strategy.clear, sync_backend)
+
+    async def close(self) -> None:
+        """Close the wrapped strategy, then shut down the wrapper's thread pool."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if hasattr(self.strategy, "close"):
+                # close() may block (a write-back flush), so keep it off the loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, self.strategy.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def _check_closed(self) -> None:
+        """Check if the wrapper is closed."""
+        if self._closed:
+            raise StrategyError("Strategy wrapper is closed")
+
+    async def __aenter__(self) -> "AsyncStrategyWrapper":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
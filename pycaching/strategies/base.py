@@ -1,6 +1,8 @@
 """Base strategy implementation."""
 
-from typing import Optional
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Optional
 
 from pycaching.core.backend import Backend
 from pycaching.core.strategy import BaseStrategy as CoreBaseStrategy
@@ -10,8 +12,44 @@ from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 class BaseStrategy(CoreBaseStrategy):
     """Enhanced base strategy with common functionality."""
 
+    __slots__ = ("_inflight", "_inflight_lock")
+
     def __init__(self, name: str = "base"):
         super().__init__(name)
+        # Loads in progress, so concurrent misses on a key share one callback call
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._inflight_lock = Lock()
+
+    def _single_flight(
+        self, key: CacheKey, load: Callable[[], Optional[CacheValue]]
+    ) -> Optional[CacheValue]:
+        """
+        Run load for a key at most once across concurrent callers.
+
+        The first caller runs load; callers arriving while it is in flight wait
+        for and share its result, or re-raise its exception.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = load()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def get(
         self,
@@ -20,7 +58,6 @@ class BaseStrategy(CoreBaseStrategy):
         miss_callback: Optional[CacheMissCallback] = None,
     ) -> Optional[CacheValue]:
         """Get a value using the strategy."""
-        self._validate_backend(backend)
         value = backend.get(key)
         if value is None and miss_callback is not None:
             value = miss_callback(key)
@@ -36,10 +73,8 @@ class BaseStrategy(CoreBaseStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value using the strategy."""
-        self._validate_backend(backend)
         return backend.set(key, value, ttl)
 
     def delete(self, backend: Backend, key: CacheKey) -> bool:
         """Delete a value using the strategy."""
-        self._validate_backend(backend)
         return backend.delete(key)
@@ -28,16 +28,22 @@ class CacheAsideStrategy(BaseStrategy):
         # Try to get from cache
         value = backend.get(key)
 
-        # If miss and callback provided, load from source
+        # If miss and callback provided, load from source once per concurrent miss
         if value is None and miss_callback is not None:
-            value = miss_callback(key)
-            if value is not None:
-                # Store in cache for future requests
-                backend.set(key, value)
-            return value
+            return self._single_flight(key, lambda: self._load(backend, key, miss_callback))
 
         return value
 
+    def _load(
+        self, backend: Backend, key: CacheKey, miss_callback: CacheMissCallback
+    ) -> Optional[CacheValue]:
+        """Load a missing value from source and cache it."""
+        value = miss_callback(key)
+        if value is not None:
+            # Store in cache for future requests
+            backend.set(key, value)
+        return value
+
     def set(
         self,
         backend: Backend,
@@ -1,6 +1,6 @@
 """Eviction policy implementations (LRU, LFU, FIFO)."""
 
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 from collections import OrderedDict, deque
 from threading import Lock
 
@@ -9,20 +9,91 @@ from pycaching.strategies.base import BaseStrategy
 from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 
 
+def _shard_capacity(max_size: int, num_shards: int) -> int:
+    """Validate sizing arguments and return the per-shard capacity."""
+    if max_size <= 0:
+        raise ValueError("max_size must be positive")
+    if num_shards <= 0:
+        raise ValueError("num_shards must be positive")
+    # Round up so the shards together hold at least max_size keys
+    return -(-max_size // num_shards)
+
+
+# Fields of an LRU list node; nodes are plain lists, as in functools.lru_cache
+_PREV, _NEXT, _KEY = 0, 1, 2
+
+
+class _LRUShard:
+    """
+    Access order and lock for one partition of an LRU strategy.
+
+    Keys are kept in a circular doubly linked list ordered from least to most
+    recently used, with a sentinel root node and a key -> node map.
+    """
+
+    __slots__ = ("max_size", "nodes", "root", "lock")
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.nodes: Dict[CacheKey, list] = {}
+        self.root: list = []
+        self.root[:] = [self.root, self.root, None]
+        self.lock = Lock()
+
+    def touch(self, key: CacheKey) -> None:
+        """Mark a key most recently used, tracking it if new (caller holds the lock)."""
+        node = self.nodes.get(key)
+        if node is None:
+            node = [None, None, key]
+            self.nodes[key] = node
+        else:
+            node[_PREV][_NEXT] = node[_NEXT]
+            node[_NEXT][_PREV] = node[_PREV]
+        root = self.root
+        last = root[_PREV]
+        node[_PREV] = last
+        node[_NEXT] = root
+        last[_NEXT] = root[_PREV] = node
+
+    def discard(self, key: CacheKey) -> None:
+        """Stop tracking a key (caller holds the lock)."""
+        node = self.nodes.pop(key, None)
+        if node is not None:
+            node[_PREV][_NEXT] = node[_NEXT]
+            node[_NEXT][_PREV] = node[_PREV]
+
+    def evict(self) -> CacheKey:
+        """Pop the least recently used key (caller holds the lock)."""
+        key = self.root[_NEXT][_KEY]
+        self.discard(key)
+        return key
+
+    def clear(self) -> None:
+        """Drop all tracked keys (caller holds the lock)."""
+        self.nodes.clear()
+        self.root[:] = [self.root, self.root, None]
+
+
 class LRUEvictionStrategy(BaseStrategy):
     """
     Least Recently Used (LRU) eviction strategy.
 
-    Evicts the least recently used items when the cache is full.
+    Evicts the least recently used items when the cache is full. With
+    num_shards > 1 keys are partitioned by hash, each partition has its own
+    lock and evicts within max_size / num_shards, so the global bound and
+    recency order become approximate in exchange for less lock contention.
     """
 
-    def __init__(self, max_size: int = 100, name: str = "lru"):
+    def __init__(self, max_size: int = 100, name: str = "lru", num_shards: int = 1):
         super().__init__(name)
-        if max_size <= 0:
-            raise ValueError("max_size must be positive")
+        capacity = _shard_capacity(max_size, num_shards)
         self.max_size = max_size
-        self._access_order: OrderedDict[CacheKey, None] = OrderedDict()
-        self._lock = Lock()
+        self.num_shards = num_shards
+        self._shards: List[_LRUShard] = [_LRUShard(capacity) for _ in range(num_shards)]
+
+    def _shard_for(self, key: CacheKey) -> _LRUShard:
+        """Get the shard that owns a key."""
+        return self._shards[hash(key) % self.num_shards]
 
     def get(
         self,
@@ -33,12 +104,10 @@ class LRUEvictionStrategy(BaseStrategy):
         """Get a value, updating access order."""
         value = backend.get(key)
         if value is not None:
-            with self._lock:
+            shard = self._shard_for(key)
+            with shard.lock:
                 # Move to end (most recently used)
-                if key in self._access_order:
-                    self._access_order.move_to_end(key)
-                else:
-                    self._access_order[key] = None
+                shard.touch(key)
         elif miss_callback is not None:
             value = miss_callback(key)
             if value is not None:
@@ -53,17 +122,15 @@ class LRUEvictionStrategy(BaseStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value, evicting if necessary."""
-        with self._lock:
+        shard = self._shard_for(key)
+        with shard.lock:
             # Check if we need to evict
-            if key not in self._access_order and len(self._access_order) >= self.max_size:
+            if key not in shard.nodes and len(shard.nodes) >= shard.max_size:
                 # Evict least recently used
-                lru_key = next(iter(self._access_order))
-                backend.delete(lru_key)
-                del self._access_order[lru_key]
+                backend.delete(shard.evict())
 
             # Add/update in access order
-            self._access_order[key] = None
-            self._access_order.move_to_end(key)
+            shard.touch(key)
 
         return backend.set(key, value, ttl)
 
@@ -71,31 +138,93 @@ class LRUEvictionStrategy(BaseStrategy):
         """Delete a key and remove from access order."""
         result = backend.delete(key)
         if result:
-            with self._lock:
-                self._access_order.pop(key, None)
+            shard = self._shard_for(key)
+            with shard.lock:
+                shard.discard(key)
         return result
 
     def clear(self, backend: Backend) -> bool:
         """Clear cache and access order."""
-        with self._lock:
-            self._access_order.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
         return backend.clear()
 
 
+class _LFUShard:
+    """Frequency buckets and lock for one partition of an LFU strategy."""
+
+    __slots__ = ("max_size", "key_to_freq", "freq_to_keys", "min_freq", "lock")
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.key_to_freq: Dict[CacheKey, int] = {}
+        self.freq_to_keys: Dict[int, OrderedDict[CacheKey, None]] = {}
+        self.min_freq = 0
+        self.lock = Lock()
+
+    def insert(self, key: CacheKey, freq: int) -> None:
+        """Add a key to a frequency bucket (caller holds the lock)."""
+        if not self.key_to_freq or freq < self.min_freq:
+            self.min_freq = freq
+        self.key_to_freq[key] = freq
+        self.freq_to_keys.setdefault(freq, OrderedDict())[key] = None
+
+    def remove(self, key: CacheKey) -> int:
+        """Remove a key from its frequency bucket and return its frequency."""
+        freq = self.key_to_freq.pop(key)
+        bucket = self.freq_to_keys[freq]
+        del bucket[key]
+        if not bucket:
+            del self.freq_to_keys[freq]
+        return freq
+
+    def increment(self, key: CacheKey) -> None:
+        """Move a key to the next frequency bucket (caller holds the lock)."""
+        if key not in self.key_to_freq:
+            self.insert(key, 1)
+            return
+        freq = self.remove(key)
+        if freq == self.min_freq and freq not in self.freq_to_keys:
+            self.min_freq = freq + 1
+        self.insert(key, freq + 1)
+
+    def evict(self) -> CacheKey:
+        """Pop the least frequently used key (caller holds the lock)."""
+        if self.min_freq not in self.freq_to_keys:
+            # A delete emptied the lowest bucket
+            self.min_freq = min(self.freq_to_keys)
+        lfu_key = next(iter(self.freq_to_keys[self.min_freq]))
+        self.remove(lfu_key)
+        return lfu_key
+
+    def clear(self) -> None:
+        """Drop all tracked keys (caller holds the lock)."""
+        self.key_to_freq.clear()
+        self.freq_to_keys.clear()
+        self.min_freq = 0
+
+
 class LFUEvictionStrategy(BaseStrategy):
     """
     Least Frequently Used (LFU) eviction strategy.
 
-    Evicts the least frequently used items when the cache is full.
+    Evicts the least frequently used items when the cache is full. Keys are
+    grouped into frequency buckets so access and eviction are O(1); ties are
+    broken by evicting the least recently used key in the lowest bucket.
+    With num_shards > 1 each hash partition evicts independently.
     """
 
-    def __init__(self, max_size: int = 100, name: str = "lfu"):
+    def __init__(self, max_size: int = 100, name: str = "lfu", num_shards: int = 1):
         super().__init__(name)
-        if max_size <= 0:
-            raise ValueError("max_size must be positive")
+        capacity = _shard_capacity(max_size, num_shards)
         self.max_size = max_size
-        self._access_counts: Dict[CacheKey, int] = {}
-        self._lock = Lock()
+        self.num_shards = num_shards
+        self._shards: List[_LFUShard] = [_LFUShard(capacity) for _ in range(num_shards)]
+
+    def _shard_for(self, key: CacheKey) -> _LFUShard:
+        """Get the shard that owns a key."""
+        return self._shards[hash(key) % self.num_shards]
 
     def get(
         self,
@@ -106,8 +235,9 @@ class LFUEvictionStrategy(BaseStrategy):
         """Get a value, incrementing access count."""
         value = backend.get(key)
         if value is not None:
-            with self._lock:
-                self._access_counts[key] = self._access_counts.get(key, 0) + 1
+            shard = self._shard_for(key)
+            with shard.lock:
+                shard.increment(key)
         elif miss_callback is not None:
             value = miss_callback(key)
             if value is not None:
@@ -122,17 +252,15 @@ class LFUEvictionStrategy(BaseStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value, evicting if necessary."""
-        with self._lock:
-            # Check if we need to evict
-            if key not in self._access_counts and len(self._access_counts) >= self.max_size:
+        shard = self._shard_for(key)
+        with shard.lock:
+            if key not in shard.key_to_freq:
                 # Evict least frequently used
-                lfu_key = min(self._access_counts.items(), key=lambda x: x[1])[0]
-                backend.delete(lfu_key)
-                del self._access_counts[lfu_key]
+                if len(shard.key_to_freq) >= shard.max_size:
+                    backend.delete(shard.evict())
 
-            # Initialize access count if new key
-            if key not in self._access_counts:
-                self._access_counts[key] = 0
+                # Initialize access count for new key
+                shard.insert(key, 0)
 
         return backend.set(key, value, ttl)
 
@@ -140,31 +268,74 @@ class LFUEvictionStrategy(BaseStrategy):
         """Delete a key and remove from access counts."""
         result = backend.delete(key)
         if result:
-            with self._lock:
-                self._access_counts.pop(key, None)
+            shard = self._shard_for(key)
+            with shard.lock:
+                if key in shard.key_to_freq:
+                    shard.remove(key)
         return result
 
     def clear(self, backend: Backend) -> bool:
         """Clear cache and access counts."""
-        with self._lock:
-            self._access_counts.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
         return backend.clear()
 
 
+class _FIFOShard:
+    """Insertion queue and lock for one partition of a FIFO strategy."""
+
+    __slots__ = ("max_size", "insertion_order", "alive", "sequence", "lock")
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # (key, sequence) in insertion order; an entry is live only if its
+        # sequence matches alive[key], so re-inserted keys are not evicted early
+        self.insertion_order: Deque[Tuple[CacheKey, int]] = deque()
+        self.alive: Dict[CacheKey, int] = {}
+        self.sequence = 0
+        self.lock = Lock()
+
+    def evict(self) -> Optional[CacheKey]:
+        """Pop the oldest live key, discarding tombstones (caller holds the lock)."""
+        while self.insertion_order:
+            key, sequence = self.insertion_order.popleft()
+            if self.alive.get(key) == sequence:
+                del self.alive[key]
+                return key
+        return None
+
+    def discard(self, key: CacheKey) -> None:
+        """Tombstone a key, compacting the queue when stale entries pile up."""
+        self.alive.pop(key, None)
+        # Compact once tombstones outnumber live entries
+        if len(self.insertion_order) > 2 * len(self.alive) + 16:
+            self.insertion_order = deque(
+                entry
+                for entry in self.insertion_order
+                if self.alive.get(entry[0]) == entry[1]
+            )
+
+
 class FIFOEvictionStrategy(BaseStrategy):
     """
     First In First Out (FIFO) eviction strategy.
 
-    Evicts the oldest items when the cache is full.
+    Evicts the oldest items when the cache is full. Deletes only tombstone the
+    key; stale queue entries are skipped at eviction time. With num_shards > 1
+    each hash partition keeps its own queue.
     """
 
-    def __init__(self, max_size: int = 100, name: str = "fifo"):
+    def __init__(self, max_size: int = 100, name: str = "fifo", num_shards: int = 1):
         super().__init__(name)
-        if max_size <= 0:
-            raise ValueError("max_size must be positive")
+        capacity = _shard_capacity(max_size, num_shards)
         self.max_size = max_size
-        self._insertion_order: Deque[CacheKey] = deque()
-        self._lock = Lock()
+        self.num_shards = num_shards
+        self._shards: List[_FIFOShard] = [_FIFOShard(capacity) for _ in range(num_shards)]
+
+    def _shard_for(self, key: CacheKey) -> _FIFOShard:
+        """Get the shard that owns a key."""
+        return self._shards[hash(key) % self.num_shards]
 
     def get(
         self,
@@ -188,32 +359,35 @@ class FIFOEvictionStrategy(BaseStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value, evicting if necessary."""
-        with self._lock:
-            # Check if we need to evict
-            if key not in self._insertion_order and len(self._insertion_order) >= self.max_size:
+        shard = self._shard_for(key)
+        with shard.lock:
+            if key not in shard.alive:
                 # Evict oldest (first in)
-                oldest_key = self._insertion_order.popleft()
-                backend.delete(oldest_key)
+                if len(shard.alive) >= shard.max_size:
+                    oldest_key = shard.evict()
+                    if oldest_key is not None:
+                        backend.delete(oldest_key)
 
-            # Add to insertion order if new
-            if key not in self._insertion_order:
-                self._insertion_order.append(key)
+                # Add to insertion order
+                shard.sequence += 1
+                shard.alive[key] = shard.sequence
+                shard.insertion_order.append((key, shard.sequence))
 
         return backend.set(key, value, ttl)
 
     def delete(self, backend: Backend, key: CacheKey) -> bool:
-        """Delete a key and remove from insertion order."""
+        """Delete a key and tombstone its insertion-order entry."""
         result = backend.delete(key)
         if result:
-            with self._lock:
-                try:
-                    self._insertion_order.remove(key)
-                except ValueError:
-                    pass  # Key not in queue
+            shard = self._shard_for(key)
+            with shard.lock:
+                shard.discard(key)
         return result
 
     def clear(self, backend: Backend) -> bool:
         """Clear cache and insertion order."""
-        with self._lock:
-            self._insertion_order.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.insertion_order.clear()
+                shard.alive.clear()
         return backend.clear()
@@ -4,7 +4,7 @@ from typing import Callable, Optional
 
 from pycaching.core.backend import Backend
 from pycaching.strategies.base import BaseStrategy
-from pycaching.core.types import CacheKey, CacheValue
+from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 
 
 ReadCallback = Callable[[CacheKey], CacheValue]
@@ -36,16 +36,21 @@ class ReadThroughStrategy(BaseStrategy):
         # Try to get from cache
         value = backend.get(key)
 
-        # If miss, load from data store
+        # If miss, load from data store once per concurrent miss
         if value is None:
             callback = miss_callback or self.read_callback
             if callback is not None:
-                try:
-                    value = callback(key)
-                    if value is not None:
-                        # Store in cache for future requests
-                        backend.set(key, value)
-                except Exception as e:
-                    raise RuntimeError(f"Failed to read from data store: {e}") from e
+                value = self._single_flight(key, lambda: self._load(backend, key, callback))
 
         return value
+
+    def _load(self, backend: Backend, key: CacheKey, callback: ReadCallback) -> Optional[CacheValue]:
+        """Load a missing value from the data store and cache it."""
+        try:
+            value = callback(key)
+            if value is not None:
+                # Store in cache for future requests
+                backend.set(key, value)
+        except Exception as e:
+            raise RuntimeError(f"Failed to read from data store: {e}") from e
+        return value
@@ -1,36 +1,53 @@
 """Refresh-ahead strategy implementation."""
 
-from typing import Callable, Dict, Optional
-from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+from threading import Condition, Thread
+import heapq
+import itertools
+import logging
 import time
 
 from pycaching.core.backend import Backend
 from pycaching.strategies.base import BaseStrategy
-from pycaching.core.types import CacheKey, CacheValue
+from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 
 
+logger = logging.getLogger(__name__)
+
 RefreshCallback = Callable[[CacheKey], CacheValue]
 
+# Upper bound on the exponential backoff between retries of a failing refresh
+_MAX_RETRY_DELAY = 60.0
+
 
 class RefreshAheadStrategy(BaseStrategy):
     """
     Refresh-ahead strategy.
 
     Entries are refreshed proactively before they expire, reducing
-    the chance of cache misses.
+    the chance of cache misses. Refreshes are kept in a min-heap ordered by
+    due time, so the background thread sleeps until the next one is due. A
+    refresh whose callback raises is retried with exponential backoff.
     """
 
     def __init__(
         self,
         refresh_callback: Optional[RefreshCallback] = None,
         refresh_threshold: float = 0.8,  # Refresh when 80% of TTL has passed
+        refresh_interval: float = 1.0,  # Refresh period for entries without a TTL
         name: str = "refresh_ahead",
     ):
         super().__init__(name)
         self.refresh_callback = refresh_callback
         self.refresh_threshold = refresh_threshold
-        self._refresh_times: Dict[CacheKey, float] = {}
-        self._lock = Lock()
+        self.refresh_interval = refresh_interval
+        # (due time, sequence, key); entries whose sequence no longer matches
+        # _scheduled[key] were superseded or deleted and are skipped when popped
+        self._heap: List[Tuple[float, int, CacheKey]] = []
+        # key -> (sequence, ttl, consecutive failed refreshes)
+        self._scheduled: Dict[CacheKey, Tuple[int, Optional[float], int]] = {}
+        self._sequence = itertools.count()
+        self._condition = Condition()
         self._running = False
         self._refresh_thread: Optional[Thread] = None
 
@@ -40,20 +57,15 @@ class RefreshAheadStrategy(BaseStrategy):
         key: CacheKey,
         miss_callback: Optional[CacheMissCallback] = None,
     ) -> Optional[CacheValue]:
-        """Get a value, scheduling refresh if needed."""
+        """Get a value, loading and scheduling a refresh on a miss."""
         value = backend.get(key)
 
-        # If found, check if refresh is needed
-        if value is not None and self.refresh_callback is not None:
-            self._schedule_refresh(backend, key)
-
         # If miss, use callback
         if value is None and miss_callback is not None:
             value = miss_callback(key)
             if value is not None:
-                backend.set(key, value)
-                with self._lock:
-                    self._refresh_times[key] = time.time()
+                if backend.set(key, value):
+                    self._schedule_refresh(backend, key, None)
 
         return value
 
@@ -64,85 +76,118 @@ class RefreshAheadStrategy(BaseStrategy):
         value: CacheValue,
         ttl: Optional[float] = None,
     ) -> bool:
-        """Set a value and record refresh time."""
+        """Set a value and schedule its refresh."""
         result = backend.set(key, value, ttl)
         if result:
-            with self._lock:
-                self._refresh_times[key] = time.time()
+            self._schedule_refresh(backend, key, ttl)
         return result
 
-    def _schedule_refresh(self, backend: Backend, key: CacheKey) -> None:
-        """Schedule a refresh for a key if needed."""
+    def _schedule_refresh(self, backend: Backend, key: CacheKey, ttl: Optional[float]) -> None:
+        """Push the next refresh for a key, replacing any pending one."""
         if self.refresh_callback is None:
             return
 
-        with self._lock:
-            last_refresh = self._refresh_times.get(key, 0)
-            current_time = time.time()
-            time_since_refresh = current_time - last_refresh
+        delay = ttl * self.refresh_threshold if ttl is not None else self.refresh_interval
+        with self._condition:
+            self._push(key, ttl, 0, delay)
+            if not self._running:
+                self._start_refresh_thread(backend)
 
-            # Simple heuristic: refresh if enough time has passed
-            # In a real implementation, you'd check TTL metadata
-            if time_since_refresh > 1.0:  # Refresh if more than 1 second passed
-                # Schedule async refresh
-                if not self._running:
-                    self._start_refresh_thread(backend)
+    def _push(self, key: CacheKey, ttl: Optional[float], failures: int, delay: float) -> None:
+        """Schedule a refresh after delay, replacing any pending one (caller holds lock)."""
+        sequence = next(self._sequence)
+        self._scheduled[key] = (sequence, ttl, failures)
+        heapq.heappush(self._heap, (time.monotonic() + delay, sequence, key))
+        # Wake the worker in case this refresh is due before its current deadline
+        self._condition.notify()
 
     def _start_refresh_thread(self, backend: Backend) -> None:
-        """Start the background refresh thread."""
-        if self._running:
-            return
-
+        """Start the background refresh thread (caller holds the condition)."""
         self._running = True
 
         def refresh_worker():
-            while self._running:
+            while True:
+                with self._condition:
+                    due = self._pop_due()
+                    if due is None:
+                        if not self._running:
+                            return
+                        continue
+                key, ttl, failures = due
                 try:
-                    time.sleep(0.5)  # Check every 0.5 seconds
-                    self._refresh_expiring_keys(backend)
+                    self._refresh_key(backend, key, ttl)
                 except Exception:
-                    pass  # Ignore errors in background thread
-
-        self._refresh_thread = Thread(target=refresh_worker, daemon=True)
+                    delay = min(self.refresh_interval * 2 ** failures, _MAX_RETRY_DELAY)
+                    logger.exception("Refresh of key %r failed; retrying in %.1fs", key, delay)
+                    with self._condition:
+                        # A set() or delete() during the refresh takes precedence
+                        if key not in self._scheduled:
+                            self._push(key, ttl, failures + 1, delay)
+
+        self._refresh_thread = Thread(
+            target=refresh_worker, name="pycache-refresh-ahead", daemon=True
+        )
         self._refresh_thread.start()
 
-    def _refresh_expiring_keys(self, backend: Backend) -> None:
-        """Refresh keys that are about to expire."""
-        if self.refresh_callback is None:
+    def _pop_due(self) -> Optional[Tuple[CacheKey, Optional[float], int]]:
+        """
+        Wait for and pop the next due refresh (caller holds the condition).
+
+        Returns None after a wakeup with nothing due, or when stopped.
+        """
+        while self._running:
+            if not self._heap:
+                self._condition.wait()
+                return None
+            due_time, sequence, key = self._heap[0]
+            remaining = due_time - time.monotonic()
+            if remaining > 0:
+                self._condition.wait(timeout=remaining)
+                return None
+            heapq.heappop(self._heap)
+            entry = self._scheduled.get(key)
+            if entry is not None and entry[0] == sequence:
+                del self._scheduled[key]
+                return key, entry[1], entry[2]
+        return None
+
+    def _refresh_key(self, backend: Backend, key: CacheKey, ttl: Optional[float]) -> None:
+        """Reload a due key if it is still cached and schedule its next refresh."""
+        if not backend.exists(key):
             return
-
-        with self._lock:
-            keys_to_refresh = list(self._refresh_times.keys())
-
-        for key in keys_to_refresh:
-            try:
-                if backend.exists(key):
-                    # Refresh the value
-                    new_value = self.refresh_callback(key)
-                    if new_value is not None:
-                        backend.set(key, new_value)
-                        with self._lock:
-                            self._refresh_times[key] = time.time()
-            except Exception:
-                pass  # Ignore errors for individual keys
+        new_value = self.refresh_callback(key)
+        if new_value is not None:
+            self.set(backend, key, new_value, ttl)
 
     def delete(self, backend: Backend, key: CacheKey) -> bool:
-        """Delete a key and remove refresh tracking."""
+        """Delete a key and cancel its pending refresh."""
         result = backend.delete(key)
         if result:
-            with self._lock:
-                self._refresh_times.pop(key, None)
+            with self._condition:
+                self._scheduled.pop(key, None)
         return result
 
     def clear(self, backend: Backend) -> bool:
-        """Clear cache and stop refresh thread."""
-        self._stop_refresh_thread()
-        with self._lock:
-            self._refresh_times.clear()
+        """Clear cache and cancel pending refreshes, keeping the refresh thread for reuse."""
+        with self._condition:
+            self._heap.clear()
+            self._scheduled.clear()
+            self._condition.notify()
         return backend.clear()
 
+    def close(self) -> None:
+        """Cancel pending refreshes and stop the refresh thread."""
+        with self._condition:
+            self._heap.clear()
+            self._scheduled.clear()
+        self._stop_refresh_thread()
+
     def _stop_refresh_thread(self) -> None:
-        """Stop the background refresh thread."""
-        self._running = False
-        if self._refresh_thread is not None:
-            self._refresh_thread.join(timeout=1.0)
+        """Stop the background refresh thread and wait for it to exit."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        thread, self._refresh_thread = self._refresh_thread, None
+        if thread is not None:
+            # Wait for a refresh in progress, so a later restart never runs two workers
+            thread.join()
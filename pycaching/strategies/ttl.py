@@ -2,8 +2,6 @@
 
 from typing import Optional
 
-from typing import Optional
-
 from pycaching.core.backend import Backend
 from pycaching.core.exceptions import StrategyError
 from pycaching.strategies.base import BaseStrategy
@@ -13,6 +11,8 @@ from pycaching.core.types import CacheKey, CacheValue, CacheMissCallback
 class TTLStrategy(BaseStrategy):
     """Strategy that enforces TTL (Time To Live) for cache entries."""
 
+    __slots__ = ("default_ttl",)
+
     def __init__(self, default_ttl: Optional[float] = None, name: str = "ttl"):
         super().__init__(name)
         if default_ttl is not None and default_ttl <= 0:
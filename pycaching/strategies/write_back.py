@@ -1,15 +1,26 @@
 """Write-back (write-behind) strategy implementation."""
 
-from typing import Callable, Dict, Optional
-from threading import Lock
-import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from threading import Condition, Event, Lock, Thread
+from time import monotonic as _now
 
 from pycaching.core.backend import Backend
+from pycaching.core.exceptions import CacheTimeoutError
 from pycaching.strategies.base import BaseStrategy
 from pycaching.core.types import CacheKey, CacheValue
 
 
+logger = logging.getLogger(__name__)
+
 WriteCallback = Callable[[CacheKey, CacheValue], None]
+BulkWriteCallback = Callable[[Dict[CacheKey, CacheValue]], Optional[Iterable[CacheKey]]]
+
+# Data store errors worth retrying on the next flush; anything else is a bug
+_RETRYABLE_ERRORS = (OSError, ConnectionError, TimeoutError)
 
 
 class WriteBackStrategy(BaseStrategy):
@@ -17,23 +28,90 @@ class WriteBackStrategy(BaseStrategy):
     Write-back (write-behind) strategy.
 
     Data is written to the cache immediately, and written to the underlying
-    data store asynchronously or in batches.
+    data store asynchronously or in batches. Flushes run on a background
+    thread, started on the first queued write, when the queue reaches
+    batch_size or flush_interval has elapsed.
     """
 
+    __slots__ = (
+        "write_callback",
+        "batch_size",
+        "flush_interval",
+        "max_workers",
+        "max_queue_size",
+        "queue_timeout",
+        "bulk_write_callback",
+        "_write_queue",
+        "_lock",
+        "_flush_lock",
+        "_space",
+        "_in_flight",
+        "_reserved",
+        "_last_flush",
+        "_flush_event",
+        "_stop",
+        "_flusher",
+        "_executor",
+    )
+
     def __init__(
         self,
         write_callback: Optional[WriteCallback] = None,
         batch_size: int = 10,
         flush_interval: float = 5.0,
+        max_workers: int = 1,
+        max_queue_size: Optional[int] = None,
+        bulk_write_callback: Optional[BulkWriteCallback] = None,
+        queue_timeout: float = 5.0,
         name: str = "write_back",
     ):
+        """
+        Initialize write-back strategy.
+
+        Args:
+            write_callback: Function called to write each queued item to the data store
+            batch_size: Number of queued writes that triggers a flush
+            flush_interval: Seconds after the last flush that trigger the next one
+            max_workers: Number of threads used to call write_callback concurrently
+                during a flush; 1 writes serially in the flushing thread
+            max_queue_size: Number of pending writes (queued or being flushed) at which
+                set() waits for a flush to make room, applying back-pressure when the
+                data store falls behind (None for unbounded)
+            bulk_write_callback: Function called once per flush with the whole batch,
+                preferred over write_callback so stores can pipeline the writes. It
+                returns an iterable of keys that failed (or None), or raises OSError
+                to re-queue the entire batch
+            queue_timeout: Seconds set() waits for room in a full queue before raising
+                CacheTimeoutError
+            name: Strategy name
+        """
         super().__init__(name)
         self.write_callback = write_callback
         self.batch_size = batch_size
         self.flush_interval = flush_interval
-        self._write_queue: Dict[CacheKey, CacheValue] = {}
-        self._lock = Lock()
-        self._last_flush = time.time()
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.bulk_write_callback = bulk_write_callback
+        # Writers append without locking (deque appends are thread-safe); flushes
+        # drain it and keep the latest value per key
+        self._write_queue: Deque[Tuple[CacheKey, CacheValue]] = deque()
+        self._lock = Lock()  # guards flusher start-up only
+        # Held across draining and writing so an older batch never lands after a newer one
+        self._flush_lock = Lock()
+        # Signalled when a flush finishes; set() waits on it while the queue is full
+        self._space = Condition(Lock())
+        self._in_flight = 0  # size of the batch being written, still counted as pending
+        self._reserved = 0  # queue slots held by set() calls writing the cache
+        self._last_flush = _now()
+        self._flush_event = Event()
+        self._stop = Event()  # replaced for each flusher thread so a restart is not stopped
+        self._flusher: Optional[Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if max_workers > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pycache-write-back"
+            )
 
     def set(
         self,
@@ -43,52 +121,187 @@ class WriteBackStrategy(BaseStrategy):
         ttl: Optional[float] = None,
     ) -> bool:
         """Set a value, writing to cache immediately and queueing for data store."""
-        # Write to cache immediately
-        result = backend.set(key, value, ttl)
+        if self.write_callback is None and self.bulk_write_callback is None:
+            return backend.set(key, value, ttl)
+        if self.max_queue_size is None:
+            result = backend.set(key, value, ttl)
+            if result:
+                self._enqueue(key, value)
+            return result
 
-        # Queue for write to data store
-        if self.write_callback is not None and result:
-            with self._lock:
-                self._write_queue[key] = value
-                self._maybe_flush()
+        with self._space:
+            if not self._has_room():
+                # The flusher is falling behind; wait for it to make room, without
+                # writing the cache, so a rejected set leaves no trace
+                self._ensure_flusher()
+                self._flush_event.set()
+                if not self._space.wait_for(self._has_room, self.queue_timeout):
+                    raise CacheTimeoutError(
+                        f"Write-back queue is full ({self.max_queue_size} pending writes)"
+                    )
+            # Hold a slot so concurrent writers cannot overfill the queue while the
+            # cache write runs outside the lock
+            self._reserved += 1
 
+        result = False
+        try:
+            result = backend.set(key, value, ttl)
+        finally:
+            with self._space:
+                self._reserved -= 1
+                if result:
+                    self._enqueue(key, value)
+                else:
+                    self._space.notify()
         return result
 
-    def _maybe_flush(self) -> None:
-        """Flush write queue if conditions are met."""
-        current_time = time.time()
-        should_flush = (
-            len(self._write_queue) >= self.batch_size
-            or (current_time - self._last_flush) >= self.flush_interval
-        )
+    def _has_room(self) -> bool:
+        """Whether pending writes are below max_queue_size (caller holds _space)."""
+        pending = len(self._write_queue) + self._in_flight + self._reserved
+        return pending < self.max_queue_size
 
-        if should_flush and self.write_callback:
-            self._flush()
+    def _enqueue(self, key: CacheKey, value: CacheValue) -> None:
+        """Queue a write for the data store, waking the flusher for a full batch."""
+        self._write_queue.append((key, value))
+        self._ensure_flusher()
+        if len(self._write_queue) >= self.batch_size:
+            # Hand the flush to the background thread
+            self._flush_event.set()
 
-    def _flush(self) -> None:
-        """Flush all queued writes to the data store."""
-        if not self._write_queue:
-            return
+    def _ensure_flusher(self) -> None:
+        """Start the background flush thread unless it is running."""
+        if self._flusher is None:
+            with self._lock:
+                if self._flusher is None:
+                    self._start_flusher()
 
-        queue_copy = self._write_queue.copy()
-        self._write_queue.clear()
-        self._last_flush = time.time()
+    def _start_flusher(self) -> None:
+        """Start the background flush thread (caller holds the lock)."""
+        self._stop = Event()
+        self._flusher = Thread(target=self._run_flusher, args=(self._stop,), daemon=True)
+        self._flusher.start()
 
-        # Write all queued items
-        for key, value in queue_copy.items():
+    def _run_flusher(self, stop: Event) -> None:
+        """Flush when signalled for a full batch or when flush_interval elapses."""
+        while not stop.is_set():
+            timeout = self._last_flush + self.flush_interval - _now()
+            self._flush_event.wait(max(timeout, 0.0))
+            self._flush_event.clear()
+            if stop.is_set():
+                return
             try:
-                self.write_callback(key, value)
+                self.flush()
             except Exception:
-                # On error, re-queue the item
-                self._write_queue[key] = value
+                # Retryable failures are already re-queued; report the dropped writes
+                logger.exception("Background write-back flush failed; dropped non-retryable writes")
+
+    def _take_batch(self) -> Dict[CacheKey, CacheValue]:
+        """Drain queued writes, keeping the latest value per key (caller holds the flush lock)."""
+        batch: Dict[CacheKey, CacheValue] = {}
+        queue = self._write_queue
+        # Writes appended while draining are left for the next flush
+        for _ in range(len(queue)):
+            key, value = queue.popleft()
+            batch[key] = value
+        self._last_flush = _now()
+        return batch
+
+    def _safe_write(self, item: Tuple[CacheKey, CacheValue]) -> bool:
+        """Write one item to the data store, returning False on a retryable error."""
+        try:
+            self.write_callback(*item)
+            return True
+        except _RETRYABLE_ERRORS:
+            return False
+
+    def _write_batch(self, batch: Dict[CacheKey, CacheValue]) -> None:
+        """
+        Write a drained batch (caller holds the flush lock), re-queueing failures.
+
+        Items that fail with a retryable (I/O) error are re-queued. Any other
+        error is a bug in the callback: the item is dropped rather than retried
+        forever, the rest of the batch is still written, and the first such
+        error is re-raised.
+        """
+        error: Optional[Exception] = None
+        if self.bulk_write_callback is not None:
+            failed = self._bulk_write(batch)
+        elif self.write_callback is not None:
+            failed, error = self._write_items(batch)
+        else:
+            return
+
+        # On error, re-queue at the front so values queued meanwhile still win
+        self._write_queue.extendleft(reversed(failed))
+        if error is not None:
+            raise error
+
+    def _bulk_write(self, batch: Dict[CacheKey, CacheValue]) -> List[Tuple[CacheKey, CacheValue]]:
+        """Write a batch with one bulk_write_callback call, returning the failed items."""
+        try:
+            failed_keys = self.bulk_write_callback(batch)
+        except _RETRYABLE_ERRORS:
+            return list(batch.items())
+        if not failed_keys:
+            return []
+        return [(key, batch[key]) for key in failed_keys if key in batch]
+
+    def _write_items(
+        self, batch: Dict[CacheKey, CacheValue]
+    ) -> Tuple[List[Tuple[CacheKey, CacheValue]], Optional[Exception]]:
+        """Write a batch item by item, returning the retryable failures and the first error."""
+        items = list(batch.items())
+        if self._executor is not None and len(items) > 1:
+            futures = [self._executor.submit(self._safe_write, item) for item in items]
+            writes = [future.result for future in futures]
+        else:
+            writes = [partial(self._safe_write, item) for item in items]
+
+        failed: List[Tuple[CacheKey, CacheValue]] = []
+        error: Optional[Exception] = None
+        for item, write in zip(items, writes):
+            try:
+                if not write():
+                    failed.append(item)
+            except Exception as e:
+                if error is None:
+                    error = e
+        return failed, error
 
     def flush(self) -> None:
         """Manually flush the write queue."""
-        with self._lock:
-            self._flush()
+        space = self._space
+        with self._flush_lock:
+            with space:
+                batch = self._take_batch()
+                self._in_flight = len(batch)
+            if not batch:
+                return
+            try:
+                self._write_batch(batch)
+            finally:
+                # Failures are back in the queue, so they still count against the limit
+                with space:
+                    self._in_flight = 0
+                    space.notify_all()
 
     def clear(self, backend: Backend) -> bool:
         """Clear cache and flush any pending writes."""
-        with self._lock:
-            self._flush()
+        self.flush()
         return backend.clear()
+
+    def close(self) -> None:
+        """Stop the background flusher, flush pending writes and shut down the thread pool."""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+            stop = self._stop
+        if flusher is not None:
+            stop.set()
+            self._flush_event.set()
+            flusher.join()
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
@@ -17,6 +17,8 @@ class WriteThroughStrategy(BaseStrategy):
     Data is written to both the cache and the underlying data store simultaneously.
     """
 
+    __slots__ = ("write_callback",)
+
     def __init__(
         self,
         write_callback: Optional[WriteCallback] = None,
@@ -1,10 +1,51 @@
 """Async utilities for sync/async interop."""
 
 import asyncio
-from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+import functools
+import os
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Threads that run coroutines for run_async callers already inside an event loop
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+# Threads that run sync functions wrapped by sync_to_async, kept apart from the
+# loop's default executor so other libraries do not contend for it
+_SYNC_TO_ASYNC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+# Per-thread asyncio.Runner (Python 3.11+), or event loop on older versions,
+# reused across run_async calls; in_worker marks threads running a coroutine
+# handed off by run_async
+_RUNNERS = threading.local()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared run_async executor, creating it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="pycaching-runasync"
+                )
+    return _EXECUTOR
+
+
+def _get_sync_to_async_executor() -> ThreadPoolExecutor:
+    """Get the shared sync_to_async executor, creating it on first use."""
+    global _SYNC_TO_ASYNC_EXECUTOR
+    if _SYNC_TO_ASYNC_EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _SYNC_TO_ASYNC_EXECUTOR is None:
+                _SYNC_TO_ASYNC_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="pycaching-sync2async",
+                )
+    return _SYNC_TO_ASYNC_EXECUTOR
+
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """
@@ -17,20 +58,77 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
         The result of the coroutine
     """
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        pass
+    else:
+        # A loop is already running in this thread, so run on another thread
+        if getattr(_RUNNERS, "in_worker", False):
+            # Nested call from a coroutine already handed off: waiting on the shared
+            # pool could deadlock once every worker is blocked the same way
+            return _run_in_new_thread(coro)
+        return _get_executor().submit(_run_in_worker, coro).result()
 
-    if loop.is_running():
-        # If loop is already running, we need to use a different approach
-        import concurrent.futures
+    if sys.version_info >= (3, 11):
+        runner = getattr(_RUNNERS, "runner", None)
+        if runner is None:
+            runner = _RUNNERS.runner = asyncio.Runner()
+        return runner.run(coro)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    else:
-        return loop.run_until_complete(coro)
+    loop = getattr(_RUNNERS, "loop", None)
+    if loop is None or loop.is_closed():
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        _RUNNERS.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def _run_in_worker(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a fresh event loop in a thread marked as a run_async worker."""
+    _RUNNERS.in_worker = True
+    try:
+        return asyncio.run(coro)
+    finally:
+        _RUNNERS.in_worker = False
+
+
+def _run_in_new_thread(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a dedicated thread and wait for its result."""
+    future: "Future[T]" = Future()
+
+    def target() -> None:
+        try:
+            future.set_result(_run_in_worker(coro))
+        except BaseException as e:
+            future.set_exception(e)
+
+    thread = threading.Thread(target=target, name="pycaching-runasync-nested", daemon=True)
+    thread.start()
+    return future.result()
+
+
+def shutdown() -> None:
+    """Close this thread's run_async runner or loop and shut down the shared executors."""
+    global _EXECUTOR, _SYNC_TO_ASYNC_EXECUTOR
+    runner = getattr(_RUNNERS, "runner", None)
+    if runner is not None:
+        runner.close()
+        _RUNNERS.runner = None
+    loop = getattr(_RUNNERS, "loop", None)
+    if loop is not None:
+        loop.close()
+        _RUNNERS.loop = None
+    with _EXECUTOR_LOCK:
+        executors = (_EXECUTOR, _SYNC_TO_ASYNC_EXECUTOR)
+        _EXECUTOR = _SYNC_TO_ASYNC_EXECUTOR = None
+    for executor in executors:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
 
 def sync_to_async(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
@@ -44,7 +142,9 @@ def sync_to_async(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
         An async function that wraps the sync function
     """
     async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_sync_to_async_executor(), functools.partial(func, *args, **kwargs)
+        )
 
     return async_wrapper
@@ -2,26 +2,76 @@
 
 import hashlib
 import json
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union
 
 from pycaching.core.types import CacheKey
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
 
-def hash_key(key: CacheKey, algorithm: str = "sha256") -> str:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Direct constructors for common algorithms, skipping hashlib.new()'s name lookup
+_HASHERS = {
+    "sha256": hashlib.sha256,
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "blake2b": hashlib.blake2b,
+}
+
+
+def _default_hash(data: bytes) -> str:
+    """128-bit BLAKE2b key digest, identical on every host."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _blake3_hash(data: bytes) -> str:
+    """128-bit BLAKE3 key digest (requires the blake3 package)."""
+    if blake3 is None:
+        raise ImportError(
+            "blake3 is required for algorithm='blake3'. Install with: pip install blake3"
+        )
+    return blake3(data).hexdigest(length=16)
+
+
+def hash_key(key: CacheKey, algorithm: str = "default") -> str:
     """
     Hash a cache key to a fixed-length string.
 
     Args:
         key: The cache key to hash
-        algorithm: Hash algorithm to use (sha256, md5, etc.)
+        algorithm: Hash algorithm to use. "default" gives a fast 32-character
+            BLAKE2b digest that is the same on every host; "blake3" gives a
+            32-character BLAKE3 digest (requires the blake3 package). Any
+            hashlib name (sha256, md5, etc.) is also accepted
 
     Returns:
         Hashed key as hexadecimal string
     """
-    key_str = _key_to_string(key)
-    hash_obj = hashlib.new(algorithm)
-    hash_obj.update(key_str.encode("utf-8"))
-    return hash_obj.hexdigest()
+    if isinstance(key, (bytes, bytearray)):
+        return _hash_cached(bytes(key), algorithm)
+    return _hash_cached(_key_to_string(key), algorithm)
+
+
+@lru_cache(maxsize=4096)
+def _hash_cached(data: Union[str, bytes], algorithm: str) -> str:
+    """Hash a key string or bytes, memoizing digests of recently hashed keys."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if algorithm == "default":
+        return _default_hash(data)
+    if algorithm == "blake3":
+        return _blake3_hash(data)
+    hasher = _HASHERS.get(algorithm)
+    if hasher is None:
+        return hashlib.new(algorithm, data).hexdigest()
+    return hasher(data).hexdigest()
 
 
 def generate_key(
@@ -44,34 +94,90 @@ def generate_key(
     Returns:
         Generated cache key string
     """
-    parts = []
+    # Fast path: only string positional arguments need no conversion
+    if not kwargs and key_func is None and all(type(arg) is str for arg in args):
+        if not prefix:
+            return separator.join(args)
+        if len(args) == 1:
+            # prefix + one argument: concatenation beats building a tuple to join
+            return prefix + separator + args[0]
+        return separator.join((prefix, *args))
+
+    parts: List[str] = [""] * ((1 if prefix else 0) + len(args) + len(kwargs))
+    i = 0
 
     if prefix:
-        parts.append(prefix)
+        parts[0] = prefix
+        i = 1
 
     # Add positional arguments
     for arg in args:
-        parts.append(_value_to_string(arg, key_func))
+        parts[i] = _value_to_string(arg, key_func)
+        i += 1
 
     # Add keyword arguments (sorted for consistency)
-    if kwargs:
-        sorted_kwargs = sorted(kwargs.items())
-        for key, value in sorted_kwargs:
-            parts.append(f"{key}={_value_to_string(value, key_func)}")
+    for key in sorted(kwargs):
+        parts[i] = key + "=" + _value_to_string(kwargs[key], key_func)
+        i += 1
 
+    if len(parts) == 2:
+        return parts[0] + separator + parts[1]
     return separator.join(parts)
 
 
+# Exact-type converters for cache keys; str keys, by far the most common, cost a
+# single dict lookup
+_STR_CONVERTERS = {
+    str: lambda key: key,
+    bytes: lambda key: key.decode("utf-8", errors="replace"),
+    int: str,
+    float: str,
+}
+
+
 def _key_to_string(key: CacheKey) -> str:
     """Convert a cache key to string."""
+    converter = _STR_CONVERTERS.get(type(key))
+    if converter is not None:
+        return converter(key)
+
+    # Subclasses of the built-in types
     if isinstance(key, str):
         return key
     elif isinstance(key, bytes):
         return key.decode("utf-8", errors="replace")
-    elif isinstance(key, (int, float)):
-        return str(key)
-    else:
-        return str(key)
+    return str(key)
+
+
+def _dumps(value: Any) -> str:
+    """
+    Serialize a container to canonical JSON for key generation.
+
+    Uses orjson when installed; the stdlib fallback uses the same compact, sorted,
+    non-ASCII-escaped layout so keys for typical arguments do not depend on it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; let the stdlib handle them
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+# Exact-type converters for the common argument types; one dict lookup instead
+# of an isinstance chain
+_VALUE_CONVERTERS = {
+    str: lambda value: value,
+    int: str,
+    float: str,
+    bool: str,
+    bytes: lambda value: value.decode("utf-8", errors="replace"),
+    list: _dumps,
+    tuple: lambda value: _dumps(list(value)),
+    dict: _dumps,
+}
 
 
 def _value_to_string(value: Any, key_func: Optional[Callable[[Any], str]] = None) -> str:
@@ -79,14 +185,19 @@ def _value_to_string(value: Any, key_func: Optional[Callable[[Any], str]] = None
     if key_func is not None:
         return key_func(value)
 
+    converter = _VALUE_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+
+    # Subclasses of the built-in types
     if isinstance(value, (str, int, float, bool)):
         return str(value)
     elif isinstance(value, bytes):
         return value.decode("utf-8", errors="replace")
     elif isinstance(value, (list, tuple)):
-        return json.dumps(list(value), sort_keys=True)
+        return _dumps(list(value))
     elif isinstance(value, dict):
-        return json.dumps(value, sort_keys=True)
+        return _dumps(value)
     else:
         # For complex objects, use their string representation
         return str(value)
@@ -1,7 +1,22 @@
 """Logging configuration for the caching library."""
 
 import logging
-from typing import Optional
+from typing import Optional, Set
+
+
+_LEVEL_MAP = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+}
+
+# Loggers already given a handler by setup_logging
+_CONFIGURED: Set[str] = set()
 
 
 def setup_logging(
@@ -21,6 +36,12 @@ def setup_logging(
         Configured logger instance
     """
     logger = logging.getLogger(logger_name)
+    log_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
+
+    if logger_name in _CONFIGURED and not format_string:
+        # Repeat call: only the level can change
+        logger.setLevel(log_level)
+        return logger
 
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -31,5 +52,6 @@ def setup_logging(
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.setLevel(log_level)
+    _CONFIGURED.add(logger_name)
     return logger
@@ -1,28 +1,76 @@
 """Serialization utilities for cache values."""
 
+import functools
 import json
 import pickle
-from typing import Any, Protocol
+import threading
+from typing import Any, Iterable, List, Protocol, Tuple
 
 from pycaching.core.exceptions import CacheSerializationError
 from pycaching.core.types import CacheValue, Serializer
 
 
+# Errors the serialization libraries raise for unsupported values or malformed
+# data; anything else propagates unwrapped
+_PICKLE_ERRORS = (
+    pickle.PickleError,
+    AttributeError,
+    EOFError,
+    ImportError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+    RecursionError,
+)
+# orjson's JSONEncodeError and JSONDecodeError subclass TypeError and ValueError
+_JSON_ERRORS = (TypeError, ValueError, RecursionError)
+
+
 class PickleSerializer:
     """Pickle-based serializer."""
 
+    def __init__(self, protocol: int = 5):
+        self.protocol = protocol
+
     def serialize(self, value: CacheValue) -> bytes:
         """Serialize a value using pickle."""
         try:
-            return pickle.dumps(value)
-        except Exception as e:
+            return pickle.dumps(value, protocol=self.protocol)
+        except _PICKLE_ERRORS as e:
             raise CacheSerializationError(f"Failed to serialize value: {e}") from e
 
     def deserialize(self, data: bytes) -> CacheValue:
         """Deserialize bytes using pickle."""
         try:
             return pickle.loads(data)
-        except Exception as e:
+        except _PICKLE_ERRORS as e:
+            raise CacheSerializationError(f"Failed to deserialize value: {e}") from e
+
+    def serialize_with_buffers(self, value: CacheValue) -> Tuple[bytes, List[pickle.PickleBuffer]]:
+        """
+        Serialize a value with large buffers kept out-of-band (pickle protocol 5).
+
+        Objects that support out-of-band pickling, such as numpy arrays and
+        pickle.PickleBuffer, are not copied into the pickle stream; their
+        buffers are returned alongside it so backends that store multi-part
+        values can write them without an extra copy.
+
+        Returns:
+            Tuple of (pickle stream, out-of-band buffers)
+        """
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except _PICKLE_ERRORS as e:
+            raise CacheSerializationError(f"Failed to serialize value: {e}") from e
+        return data, buffers
+
+    def deserialize_with_buffers(self, data: bytes, buffers: Iterable[Any]) -> CacheValue:
+        """Deserialize a pickle stream produced by serialize_with_buffers."""
+        try:
+            return pickle.loads(data, buffers=buffers)
+        except _PICKLE_ERRORS as e:
             raise CacheSerializationError(f"Failed to deserialize value: {e}") from e
 
 
@@ -35,17 +83,23 @@ class JSONSerializer:
             try:
                 import orjson
                 self._orjson = orjson
+                # Non-str dict keys and numpy arrays serialize without a pre-pass;
+                # dataclasses are handled natively by orjson 3
+                self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
             except ImportError:
                 self.use_orjson = False
+        # Bound once to skip module attribute lookups per call
+        self._dumps = json.dumps
+        self._loads = json.loads
 
     def serialize(self, value: CacheValue) -> bytes:
         """Serialize a value using JSON."""
         try:
             if self.use_orjson:
-                return self._orjson.dumps(value)
+                return self._orjson.dumps(value, option=self._options)
             else:
-                return json.dumps(value).encode("utf-8")
-        except Exception as e:
+                return self._dumps(value).encode()
+        except _JSON_ERRORS as e:
             raise CacheSerializationError(f"Failed to serialize value: {e}") from e
 
     def deserialize(self, data: bytes) -> CacheValue:
@@ -54,8 +108,9 @@ class JSONSerializer:
             if self.use_orjson:
                 return self._orjson.loads(data)
             else:
-                return json.loads(data.decode("utf-8"))
-        except Exception as e:
+                # json.loads accepts UTF-8 bytes directly
+                return self._loads(data)
+        except _JSON_ERRORS as e:
             raise CacheSerializationError(f"Failed to deserialize value: {e}") from e
 
 
@@ -70,19 +125,36 @@ class MsgPackSerializer:
             raise ImportError(
                 "msgpack is required for MsgPackSerializer. Install with: pip install msgpack"
             )
+        # Unpack errors that are not ValueErrors derive from UnpackException
+        self._errors = (TypeError, ValueError, OverflowError, msgpack.UnpackException)
+        # Packers are not thread-safe, so each thread reuses its own
+        self._local = threading.local()
+        # Pinned options: str and bytes round-trip distinctly across msgpack
+        # versions, and timezone-aware datetimes use the timestamp extension
+        self._unpack = functools.partial(
+            msgpack.unpackb, raw=False, strict_map_key=False, timestamp=3
+        )
+
+    def _packer(self) -> Any:
+        """Return this thread's reusable Packer."""
+        packer = getattr(self._local, "packer", None)
+        if packer is None:
+            packer = self._msgpack.Packer(use_bin_type=True, autoreset=True, datetime=True)
+            self._local.packer = packer
+        return packer
 
     def serialize(self, value: CacheValue) -> bytes:
         """Serialize a value using MessagePack."""
         try:
-            return self._msgpack.packb(value)
-        except Exception as e:
+            return self._packer().pack(value)
+        except self._errors as e:
             raise CacheSerializationError(f"Failed to serialize value: {e}") from e
 
     def deserialize(self, data: bytes) -> CacheValue:
         """Deserialize bytes using MessagePack."""
         try:
-            return self._msgpack.unpackb(data, raw=False)
-        except Exception as e:
+            return self._unpack(data)
+        except self._errors as e:
             raise CacheSerializationError(f"Failed to deserialize value: {e}") from e
 
 
@@ -2,13 +2,82 @@
 
 import csv
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pycaching.core.backend import Backend
 from pycaching.core.types import CacheKey, CacheValue
 from pycaching.visualization.metrics import MetricsCollector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to JSON bytes, compact unless pretty, with orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+# CSV columns, in the order rows are written
+_CACHE_FIELDS = ("key", "value", "exists")
+_METRIC_FIELDS = ("operation", "key", "hit", "latency_ms", "timestamp")
+# Entries written per write call when streaming exports
+_BATCH_SIZE = 1000
+# Output file buffer; large exports make far fewer write syscalls than with the 8 KiB default
+_BUFFER_SIZE = 1 << 20
+
+
+# Single thread that runs export_metrics_async jobs in submission order
+_EXPORT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXPORT_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_export_executor() -> ThreadPoolExecutor:
+    """Get the shared export thread, creating it on first use."""
+    global _EXPORT_EXECUTOR
+    if _EXPORT_EXECUTOR is None:
+        with _EXPORT_EXECUTOR_LOCK:
+            if _EXPORT_EXECUTOR is None:
+                _EXPORT_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="pycaching-export"
+                )
+    return _EXPORT_EXECUTOR
+
+
+def _batched(iterable: Iterable[Any], size: int = _BATCH_SIZE) -> Iterator[List[Any]]:
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _write_json_array(f: BinaryIO, items: Iterable[Any], pretty: bool = False) -> None:
+    """Stream items to f as a JSON array, one batch of encoded items at a time."""
+    separator = b",\n" if pretty else b","
+    f.write(b"[")
+    first = True
+    for batch in _batched(items):
+        if pretty or not first:
+            f.write(b"\n" if first else separator)
+        f.write(separator.join(_dumps(item, pretty) for item in batch))
+        first = False
+    f.write(b"\n]" if pretty and not first else b"]")
+
 
 class JSONExporter:
     """Export cache data and metrics to JSON/CSV."""
@@ -18,6 +87,7 @@ class JSONExporter:
         backend: Backend,
         output_path: str,
         format: str = "json",
+        pretty: bool = False,
     ) -> None:
         """
         Export cache data to file.
@@ -26,36 +96,55 @@ class JSONExporter:
             backend: Backend to export from
             output_path: Output file path
             format: Export format ('json' or 'csv')
+            pretty: Indent JSON output for reading; compact by default
         """
         output_path = Path(output_path)
-        data = []
+        fmt = format.lower()
+        if fmt not in ("json", "csv"):
+            raise ValueError(f"Unsupported format: {format}")
 
-        # Collect all cache entries
+        # Entries are streamed from backend.keys() rather than collected first
+        entries = JSONExporter._iter_cache_entries(backend)
+        if fmt == "json":
+            records = (
+                {"key": key, "value": value, "exists": exists} for key, value, exists in entries
+            )
+            with open(output_path, "wb", buffering=_BUFFER_SIZE) as f:
+                _write_json_array(f, records, pretty)
+        else:
+            with open(output_path, "w", newline="", buffering=_BUFFER_SIZE) as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(_CACHE_FIELDS)
+                writerow = writer.writerow
+                # writerow() does not keep the row, so one list is refilled per entry
+                row: List[Any] = [None, None, None]
+                for key, value, exists in entries:
+                    row[0] = key
+                    row[1] = value
+                    row[2] = exists
+                    writerow(row)
+
+    @staticmethod
+    def _iter_cache_entries(backend: Backend) -> Iterator[Tuple[str, Optional[str], bool]]:
+        """Yield (key, value, exists) rows for each cache entry."""
         for key in backend.keys():
+            # A None from get() already means the key is missing (or expired since
+            # keys() listed it), so no separate exists() round-trip is needed
             value = backend.get(key)
-            data.append({
-                "key": str(key),
-                "value": str(value) if value is not None else None,
-                "exists": backend.exists(key),
-            })
-
-        if format.lower() == "json":
-            with open(output_path, "w") as f:
-                json.dump(data, f, indent=2)
-        elif format.lower() == "csv":
-            with open(output_path, "w", newline="") as f:
-                if data:
-                    writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+            # Most keys (and many values) are already str; skip the str() call for them
+            if type(key) is not str:
+                key = str(key)
+            if value is None:
+                yield key, None, False
+            else:
+                yield key, value if type(value) is str else str(value), True
 
     @staticmethod
     def export_metrics(
         metrics_collector: MetricsCollector,
         output_path: str,
         format: str = "json",
+        pretty: bool = False,
     ) -> None:
         """
         Export metrics to file.
@@ -64,27 +153,60 @@ class JSONExporter:
             metrics_collector: MetricsCollector instance
             output_path: Output file path
             format: Export format ('json' or 'csv')
+            pretty: Indent JSON output for reading; compact by default
         """
         output_path = Path(output_path)
-        data = metrics_collector.export_dict()
-
-        if format.lower() == "json":
-            with open(output_path, "w") as f:
-                json.dump(data, f, indent=2)
-        elif format.lower() == "csv":
-            # Export metrics as CSV
-            with open(output_path, "w", newline="") as f:
-                if data["metrics"]:
-                    writer = csv.DictWriter(f, fieldnames=data["metrics"][0].keys())
-                    writer.writeheader()
-                    writer.writerows(data["metrics"])
-        else:
+        fmt = format.lower()
+        if fmt not in ("json", "csv"):
             raise ValueError(f"Unsupported format: {format}")
 
+        # Metrics are streamed from the collector rather than collected first
+        if fmt == "json":
+            with open(output_path, "wb", buffering=_BUFFER_SIZE) as f:
+                f.write(b'{"stats":')
+                f.write(_dumps(metrics_collector.export_stats(), pretty))
+                f.write(b',"metrics":')
+                _write_json_array(f, metrics_collector.iter_metrics(), pretty)
+                f.write(b"}")
+        else:
+            with open(output_path, "w", newline="", buffering=_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(_METRIC_FIELDS)
+                for batch in _batched(metrics_collector.iter_metric_rows()):
+                    writer.writerows(batch)
+
+    @staticmethod
+    def export_metrics_async(
+        metrics_collector: MetricsCollector,
+        output_path: str,
+        format: str = "json",
+        pretty: bool = False,
+    ) -> "Future[None]":
+        """
+        Export metrics to file on a background thread.
+
+        The calling thread, typically one serving cache traffic, returns
+        immediately; exports run one at a time in submission order. The metrics
+        history is snapshotted when the export starts.
+
+        Args:
+            metrics_collector: MetricsCollector instance
+            output_path: Output file path
+            format: Export format ('json' or 'csv')
+            pretty: Indent JSON output for reading; compact by default
+
+        Returns:
+            Future that completes when the file is written, or holds the export error
+        """
+        return _get_export_executor().submit(
+            JSONExporter.export_metrics, metrics_collector, output_path, format, pretty
+        )
+
     @staticmethod
     def export_stats(
         stats: Dict[str, Any],
         output_path: str,
+        pretty: bool = False,
     ) -> None:
         """
         Export statistics to JSON file.
@@ -92,7 +214,8 @@ class JSONExporter:
         Args:
             stats: Statistics dictionary
             output_path: Output file path
+            pretty: Indent JSON output for reading; compact by default
         """
         output_path = Path(output_path)
-        with open(output_path, "w") as f:
-            json.dump(stats, f, indent=2)
+        with open(output_path, "wb", buffering=_BUFFER_SIZE) as f:
+            f.write(_dumps(stats, pretty))
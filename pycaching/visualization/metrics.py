@@ -1,16 +1,47 @@
 """Metrics collection system for cache performance tracking."""
 
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from threading import Lock
+from functools import lru_cache
+from threading import Lock, current_thread, local
+import time
 
 from pycaching.core.types import CacheKey
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bound once; record() reads the clock for every cache operation
+_time_ns = time.time_ns
+
+# History size above which latency percentiles are computed with NumPy
+_NUMPY_MIN_SAMPLES = 10_000
+
+
+@lru_cache(maxsize=4096)
+def _iso_seconds(seconds: int) -> str:
+    """ISO 8601 local time of a whole Unix second."""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _iso(timestamp_ns: int) -> str:
+    """Format a nanosecond timestamp like datetime.isoformat(), reusing per-second prefixes."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    microseconds = nanoseconds // 1000
+    if microseconds:
+        return f"{_iso_seconds(seconds)}.{microseconds:06d}"
+    return _iso_seconds(seconds)
+
 
 class CacheMetrics:
     """Metrics for a single cache operation."""
 
+    __slots__ = ("operation", "key", "hit", "latency_ms", "timestamp_ns")
+
     def __init__(
         self,
         operation: str,
@@ -18,32 +49,107 @@ class CacheMetrics:
         hit: bool = False,
         latency_ms: float = 0.0,
         timestamp: Optional[datetime] = None,
+        timestamp_ns: int = 0,
     ):
         self.operation = operation  # 'get', 'set', 'delete', etc.
         self.key = key
         self.hit = hit
         self.latency_ms = latency_ms
-        self.timestamp = timestamp or datetime.now()
+        # Wall-clock nanoseconds; the datetime is only built when read
+        if timestamp_ns:
+            self.timestamp_ns = timestamp_ns
+        elif timestamp is None:
+            self.timestamp_ns = time.time_ns()
+        else:
+            seconds = int(timestamp.replace(microsecond=0).timestamp())
+            self.timestamp_ns = (seconds * 1_000_000 + timestamp.microsecond) * 1000
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time of the operation."""
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+# Fields of a per-operation counter row
+_COUNT, _HITS, _MISSES, _LATENCY = 0, 1, 2, 3
+
+
+class _CounterShard:
+    """Operation counters written only by the thread that owns the shard."""
+
+    __slots__ = ("thread", "records", "rows")
+
+    def __init__(self) -> None:
+        self.thread = current_thread()
+        self.records = 0  # operations counted; doubles as a change stamp
+        # operation -> [count, hits, misses, latency sum]; one lookup per record
+        self.rows: Dict[str, list] = {}
+
+    def add(self, operation: str, hit: bool, latency_ms: float) -> None:
+        """Count one operation."""
+        row = self.rows.get(operation)
+        if row is None:
+            row = self.rows[operation] = [0, 0, 0, 0.0]
+        row[_COUNT] += 1
+        if operation == "get":
+            row[_HITS if hit else _MISSES] += 1
+        row[_LATENCY] += latency_ms
+        # Stamp last: a reader seeing this stamp also sees the counts, so get_stats()
+        # never caches totals older than their stamp
+        self.records += 1
+
+    def merge(self, other: "_CounterShard") -> None:
+        """Add another shard's counters to this one."""
+        self.records += other.records
+        # Copies, since the owning thread may add operations while we iterate
+        for operation, row in other.rows.copy().items():
+            count, hits, misses, latency = row[:]
+            totals = self.rows.get(operation)
+            if totals is None:
+                self.rows[operation] = [count, hits, misses, latency]
+            else:
+                totals[_COUNT] += count
+                totals[_HITS] += hits
+                totals[_MISSES] += misses
+                totals[_LATENCY] += latency
 
 
 class MetricsCollector:
     """Collect and aggregate cache performance metrics."""
 
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, max_history: Optional[int] = 100_000):
         """
         Initialize metrics collector.
 
         Args:
             enabled: Whether to collect metrics
+            max_history: Number of most recent raw metrics to keep (None for unbounded);
+                aggregated statistics always cover every recorded operation
         """
         self.enabled = enabled
-        self._metrics: List[CacheMetrics] = []
+        self._metrics: Deque[CacheMetrics] = deque(maxlen=max_history)
         self._lock = Lock()
-        self._operation_counts: Dict[str, int] = defaultdict(int)
-        self._hit_counts: Dict[str, int] = defaultdict(int)
-        self._miss_counts: Dict[str, int] = defaultdict(int)
-        self._latency_sum: Dict[str, float] = defaultdict(float)
-        self._start_time = datetime.now()
+        # One counter shard per recording thread, so record() never contends on a
+        # lock; get_stats() sums them. Shards of finished threads fold into _retired.
+        self._local = local()
+        self._shards: List[_CounterShard] = []
+        self._retired = _CounterShard()
+        # (records counted, counter statistics) from the last get_stats()
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Uptime is measured on the monotonic clock, immune to wall-clock changes
+        self._start_ns = time.perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether to collect metrics."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        # Bind record to a no-op while disabled, so callers skip the enabled check
+        self._enabled = enabled
+        self.record = self._record if enabled else self._record_noop
 
     def record(
         self,
@@ -61,58 +167,113 @@ class MetricsCollector:
             hit: Whether it was a cache hit
             latency_ms: Operation latency in milliseconds
         """
-        if not self.enabled:
-            return
+        # Replaced per instance by the enabled setter; kept for the interface
+        if self._enabled:
+            self._record(operation, key, hit, latency_ms)
 
-        metric = CacheMetrics(operation, key, hit, latency_ms)
+    def _record(
+        self,
+        operation: str,
+        key: Optional[CacheKey] = None,
+        hit: bool = False,
+        latency_ms: float = 0.0,
+    ) -> None:
+        """Record a cache operation metric while enabled."""
+        # deque.append is atomic, and each thread only writes its own shard
+        self._metrics.append(CacheMetrics(operation, key, hit, latency_ms, None, _time_ns()))
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._new_shard()
+        shard.add(operation, hit, latency_ms)
+
+    def _record_noop(
+        self,
+        operation: str,
+        key: Optional[CacheKey] = None,
+        hit: bool = False,
+        latency_ms: float = 0.0,
+    ) -> None:
+        """Discard a cache operation metric while disabled."""
+
+    def _new_shard(self) -> _CounterShard:
+        """Create and register the calling thread's counter shard."""
+        shard = _CounterShard()
         with self._lock:
-            self._metrics.append(metric)
-            self._operation_counts[operation] += 1
-            if operation == "get":
-                if hit:
-                    self._hit_counts[operation] += 1
-                else:
-                    self._miss_counts[operation] += 1
-            self._latency_sum[operation] += latency_ms
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _aggregate(self) -> _CounterShard:
+        """Sum all shards (caller holds the lock)."""
+        totals = _CounterShard()
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+                totals.merge(shard)
+            else:
+                self._retired.merge(shard)
+        self._shards = live
+        totals.merge(self._retired)
+        return totals
 
     def get_stats(self) -> Dict[str, any]:
         """
         Get aggregated statistics.
 
+        Counter statistics are reused until another operation is recorded, so
+        frequent polling without new traffic does not re-aggregate the shards.
+
         Returns:
             Dictionary of statistics
         """
         with self._lock:
-            total_operations = sum(self._operation_counts.values())
-            total_gets = self._operation_counts.get("get", 0)
-            total_hits = sum(self._hit_counts.values())
-            total_misses = sum(self._miss_counts.values())
+            records = self._retired.records + sum(shard.records for shard in self._shards)
+            cached = self._stats_cache
+            if cached is None or cached[0] != records:
+                cached = self._stats_cache = (records, self._counter_stats())
+            stats = cached[1]
 
-            hit_rate = (
-                total_hits / total_gets if total_gets > 0 else 0.0
-            )
+        uptime_seconds = (time.perf_counter_ns() - self._start_ns) / 1e9
+        total_operations = stats["total_operations"]
+        return {
+            **stats,
+            # Copies, so callers cannot alter the cached statistics
+            "operation_counts": dict(stats["operation_counts"]),
+            "average_latencies_ms": dict(stats["average_latencies_ms"]),
+            "uptime_seconds": uptime_seconds,
+            "operations_per_second": (
+                total_operations / uptime_seconds if uptime_seconds > 0 else 0.0
+            ),
+        }
 
-            avg_latencies = {}
-            for operation, count in self._operation_counts.items():
-                if count > 0:
-                    avg_latencies[operation] = self._latency_sum[operation] / count
-
-            uptime_seconds = (datetime.now() - self._start_time).total_seconds()
-
-            return {
-                "total_operations": total_operations,
-                "total_gets": total_gets,
-                "total_hits": total_hits,
-                "total_misses": total_misses,
-                "hit_rate": hit_rate,
-                "miss_rate": 1.0 - hit_rate if total_gets > 0 else 0.0,
-                "operation_counts": dict(self._operation_counts),
-                "average_latencies_ms": avg_latencies,
-                "uptime_seconds": uptime_seconds,
-                "operations_per_second": (
-                    total_operations / uptime_seconds if uptime_seconds > 0 else 0.0
-                ),
-            }
+    def _counter_stats(self) -> Dict[str, Any]:
+        """Compute the statistics derived from the counters (caller holds the lock)."""
+        rows = self._aggregate().rows
+        operation_counts = {operation: row[_COUNT] for operation, row in rows.items()}
+        total_operations = sum(operation_counts.values())
+        total_gets = operation_counts.get("get", 0)
+        total_hits = sum(row[_HITS] for row in rows.values())
+        total_misses = sum(row[_MISSES] for row in rows.values())
+
+        hit_rate = (
+            total_hits / total_gets if total_gets > 0 else 0.0
+        )
+
+        avg_latencies = {
+            operation: row[_LATENCY] / row[_COUNT] for operation, row in rows.items()
+        }
+
+        return {
+            "total_operations": total_operations,
+            "total_gets": total_gets,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "hit_rate": hit_rate,
+            "miss_rate": 1.0 - hit_rate if total_gets > 0 else 0.0,
+            "operation_counts": operation_counts,
+            "average_latencies_ms": avg_latencies,
+        }
 
     def get_metrics(self, limit: Optional[int] = None) -> List[CacheMetrics]:
         """
@@ -126,33 +287,108 @@ class MetricsCollector:
         """
         with self._lock:
             if limit is None:
-                return self._metrics.copy()
-            return self._metrics[-limit:]
+                return list(self._metrics)
+            # Walk back from the newest entry so only the requested tail is touched
+            metrics = list(islice(reversed(self._metrics), limit))
+            metrics.reverse()
+            return metrics
+
+    def latency_percentiles(
+        self,
+        percentiles: Iterable[float] = (50, 90, 99),
+        operation: Optional[str] = None,
+    ) -> Dict[float, float]:
+        """
+        Compute latency percentiles over the retained raw metrics.
+
+        Uses linear interpolation between samples, as numpy.percentile does;
+        large histories are computed with NumPy when it is installed.
+
+        Args:
+            percentiles: Percentiles to compute, each between 0 and 100
+            operation: Only include this operation type (all operations if None)
+
+        Returns:
+            Dictionary mapping each percentile to a latency in milliseconds
+            (empty if there are no matching metrics)
+        """
+        percentiles = list(percentiles)
+        for p in percentiles:
+            if not 0 <= p <= 100:
+                raise ValueError(f"Percentiles must be between 0 and 100, got {p}")
+        latencies = [
+            m.latency_ms
+            for m in self._metrics.copy()
+            if operation is None or m.operation == operation
+        ]
+        if not latencies:
+            return {}
+
+        if np is not None and len(latencies) > _NUMPY_MIN_SAMPLES:
+            values = np.percentile(np.asarray(latencies, dtype=np.float64), percentiles)
+            return {p: float(value) for p, value in zip(percentiles, values)}
+
+        latencies.sort()
+        last = len(latencies) - 1
+        result = {}
+        for p in percentiles:
+            position = p / 100 * last
+            lower = int(position)
+            upper = min(lower + 1, last)
+            fraction = position - lower
+            result[p] = latencies[lower] + (latencies[upper] - latencies[lower]) * fraction
+        return result
 
     def clear(self) -> None:
         """Clear all collected metrics."""
         with self._lock:
             self._metrics.clear()
-            self._operation_counts.clear()
-            self._hit_counts.clear()
-            self._miss_counts.clear()
-            self._latency_sum.clear()
-            self._start_time = datetime.now()
+            # Threads create fresh shards on their next record
+            self._local = local()
+            self._shards = []
+            self._retired = _CounterShard()
+            self._stats_cache = None
+            self._start_ns = time.perf_counter_ns()
+
+    def export_stats(self) -> Dict[str, any]:
+        """Export aggregated statistics as a dictionary."""
+        return self.get_stats()
+
+    def iter_metric_rows(self) -> Iterator[Tuple[str, Optional[str], bool, float, str]]:
+        """
+        Yield raw metrics as (operation, key, hit, latency_ms, timestamp) tuples, oldest first.
+
+        Keys are stringified and timestamps ISO formatted, as in iter_metrics().
+        """
+        # Snapshot first: iterating the live deque fails if a record lands mid-loop
+        for m in self._metrics.copy():
+            yield (
+                m.operation,
+                str(m.key) if m.key else None,
+                m.hit,
+                m.latency_ms,
+                _iso(m.timestamp_ns),
+            )
+
+    def iter_metrics(self) -> Iterator[Dict[str, any]]:
+        """
+        Yield raw metrics as dictionaries, oldest first.
+
+        Dictionaries are built one at a time, so exporters can stream a long
+        history without holding every record's dictionary in memory.
+        """
+        for operation, key, hit, latency_ms, timestamp in self.iter_metric_rows():
+            yield {
+                "operation": operation,
+                "key": key,
+                "hit": hit,
+                "latency_ms": latency_ms,
+                "timestamp": timestamp,
+            }
 
     def export_dict(self) -> Dict[str, any]:
         """Export metrics as dictionary."""
-        stats = self.get_stats()
-        metrics = [
-            {
-                "operation": m.operation,
-                "key": str(m.key) if m.key else None,
-                "hit": m.hit,
-                "latency_ms": m.latency_ms,
-                "timestamp": m.timestamp.isoformat(),
-            }
-            for m in self._metrics
-        ]
         return {
-            "stats": stats,
-            "metrics": metrics,
+            "stats": self.export_stats(),
+            "metrics": list(self.iter_metrics()),
         }
@@ -0,0 +1,150 @@
+"""Unit tests for sync/async interop helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pycaching.utils.async_helpers import run_async, shutdown, sync_to_async
+
+
+@pytest.fixture(autouse=True)
+def reset_helpers():
+    """Start and end each test without a cached runner or shared executors."""
+    shutdown()
+    yield
+    shutdown()
+
+
+async def loop_and_thread():
+    """Return the running loop and the name of the thread running it."""
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+async def nested_depth(depth):
+    """Call run_async from inside a coroutine, depth levels deep."""
+    if depth == 0:
+        return 0
+    return run_async(nested_depth(depth - 1)) + 1
+
+
+def run_with_timeout(func, timeout=10):
+    """Run func on a daemon thread, failing instead of hanging if it deadlocks."""
+    results = []
+    thread = threading.Thread(target=lambda: results.append(func()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "run_async deadlocked"
+    return results[0]
+
+
+def test_run_async_nested_calls_do_not_deadlock():
+    """Test nested run_async calls deeper than the shared pool still complete."""
+
+    async def main():
+        return run_async(nested_depth(8))
+
+    assert run_with_timeout(lambda: asyncio.run(main())) == 8
+
+
+def test_run_async_outside_loop_reuses_thread_runner():
+    """Test run_async without a running loop runs inline on this thread's reused loop."""
+    first_loop, first_thread = run_async(loop_and_thread())
+    second_loop, second_thread = run_async(loop_and_thread())
+
+    assert first_loop is second_loop
+    assert not first_loop.is_closed()
+    assert first_thread == second_thread == threading.current_thread().name
+
+
+def test_run_async_inside_loop_uses_worker_thread():
+    """Test run_async inside a running loop runs the coroutine on a worker thread."""
+
+    async def main():
+        return asyncio.get_running_loop(), run_async(loop_and_thread())
+
+    outer_loop, (inner_loop, thread_name) = asyncio.run(main())
+
+    assert inner_loop is not outer_loop
+    assert thread_name.startswith("pycaching-runasync")
+
+
+def test_run_async_propagates_exceptions():
+    """Test exceptions raised by the coroutine reach the caller on both paths."""
+
+    async def fail():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        run_async(fail())
+
+    async def main():
+        run_async(fail())
+
+    with pytest.raises(KeyError):
+        asyncio.run(main())
+
+
+def test_run_async_from_two_threads():
+    """Test concurrent callers on different threads each get their own loop."""
+    barrier = threading.Barrier(2, timeout=5)
+    loops = {}
+
+    async def work(n):
+        barrier.wait()  # Both coroutines must be running at once
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop(), n
+
+    def caller(n):
+        loops[n] = [run_async(work(n)) for _ in range(2)]
+
+    threads = [threading.Thread(target=caller, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert sorted(loops) == [0, 1]
+    for n, results in loops.items():
+        assert [value for _, value in results] == [n, n]
+        assert results[0][0] is results[1][0]
+    assert loops[0][0][0] is not loops[1][0][0]
+
+
+def test_run_async_after_shutdown():
+    """Test run_async and sync_to_async work again after shutdown()."""
+    loop, _ = run_async(loop_and_thread())
+    shutdown()
+
+    assert loop.is_closed()
+    new_loop, _ = run_async(loop_and_thread())
+    assert new_loop is not loop
+
+    async def main():
+        _, thread_name = run_async(loop_and_thread())
+        return thread_name, await sync_to_async(threading.current_thread)()
+
+    thread_name, worker = asyncio.run(main())
+    assert thread_name.startswith("pycaching-runasync")
+    assert worker.name.startswith("pycaching-sync2async")
+
+
+def test_sync_to_async_uses_dedicated_executor():
+    """Test sync_to_async passes arguments through on its own executor, not the loop default."""
+
+    def describe(a, b=0):
+        return a + b, threading.current_thread().name
+
+    def fail():
+        raise ValueError("bad")
+
+    async def main():
+        result = await sync_to_async(describe)(1, b=2)
+        with pytest.raises(ValueError):
+            await sync_to_async(fail)()
+        return result
+
+    total, thread_name = asyncio.run(main())
+
+    assert total == 3
+    assert thread_name.startswith("pycaching-sync2async")
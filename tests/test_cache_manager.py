@@ -6,6 +6,7 @@ from pycaching.backends.memory import MemoryBackend
 from pycaching.core.cache import CacheManager
 from pycaching.core.config import CacheConfig
 from pycaching.strategies.cache_aside import CacheAsideStrategy
+from pycaching.strategies.write_back import WriteBackStrategy
 
 
 def test_cache_manager_basic():
@@ -45,3 +46,19 @@ def test_cache_manager_with_namespace():
     assert any("test:app:key1" in str(k) for k in keys)
 
     manager.close()
+
+
+def test_cache_manager_close_flushes_write_back():
+    """Test writes still queued for the data store are flushed on close."""
+    store = {}
+    strategy = WriteBackStrategy(
+        write_callback=store.__setitem__, batch_size=100, flush_interval=60
+    )
+    cache = CacheManager(backend=MemoryBackend(), strategy=strategy)
+
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    assert store == {}
+
+    cache.close()
+    assert store == {"default:key1": "value1", "default:key2": "value2"}
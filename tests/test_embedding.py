@@ -0,0 +1,65 @@
+"""Unit tests for embedding generation."""
+
+import numpy as np
+import pytest
+
+from pycaching.llm.embedding import EmbeddingGenerator, SimilarityCalculator
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    """Isolate tests from the process-wide embedding cache."""
+    EmbeddingGenerator.clear_global_cache()
+    yield
+    EmbeddingGenerator.clear_global_cache()
+
+
+def char_embedding(text):
+    """Deterministic custom provider: character counts of 'abc'."""
+    if isinstance(text, str):
+        return np.array([text.count(c) for c in "abc"], dtype=np.float32)
+    return np.stack([char_embedding(txt) for txt in text])
+
+
+def test_memoized_embedding_is_writable_copy():
+    """Test callers can modify a memoized embedding without corrupting the memo."""
+    generator = EmbeddingGenerator(provider="custom", custom_provider=char_embedding)
+
+    first = generator.generate("aab")
+    first /= np.linalg.norm(first)
+    assert np.allclose(generator.generate("aab"), [2, 1, 0])
+
+    batch = generator.generate(["aab", "abc"])
+    batch[0] = 0
+    assert np.allclose(generator.generate("aab"), [2, 1, 0])
+
+
+def test_shared_embedding_cache_isolated_between_generators():
+    """Test generators sharing the process-wide memo cannot modify each other's results."""
+    calls = []
+
+    def counting_embedding(text):
+        calls.append(text)
+        return char_embedding(text)
+
+    first = EmbeddingGenerator(provider="custom", custom_provider=counting_embedding)
+    second = EmbeddingGenerator(provider="custom", custom_provider=counting_embedding)
+
+    embedding = first.generate("abc")
+    embedding[:] = 0
+    assert np.allclose(second.generate("abc"), [1, 1, 1])
+    assert calls == ["abc"]
+
+
+def test_similarity_score_normalized_matches_cosine():
+    """Test the normalized dot-product path agrees with the full cosine computation."""
+    a = np.array([3.0, 4.0, 0.0], dtype=np.float32)
+    b = np.array([4.0, 3.0, 0.0], dtype=np.float32)
+
+    expected, _ = SimilarityCalculator.similarity_score(a, b)
+    score, is_similar = SimilarityCalculator.similarity_score(
+        SimilarityCalculator.normalize(a), SimilarityCalculator.normalize(b), normalized=True
+    )
+
+    assert score == pytest.approx(expected, abs=1e-6)
+    assert is_similar
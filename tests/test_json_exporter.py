@@ -0,0 +1,127 @@
+"""Unit tests for JSON and CSV exports."""
+
+import csv
+import json
+
+import pytest
+
+from pycaching.backends.memory import MemoryBackend
+from pycaching.visualization import json_exporter
+from pycaching.visualization.json_exporter import JSONExporter
+from pycaching.visualization.metrics import MetricsCollector
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run each export with orjson (when installed) and with the stdlib json module."""
+    if request.param == "orjson":
+        if json_exporter.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_exporter, "orjson", None)
+    return request.param
+
+
+def make_backend(count):
+    """Create a backend holding count entries with mixed value types."""
+    backend = MemoryBackend()
+    for i in range(count):
+        backend.set(f"key{i}", {"n": i} if i % 2 else f"value,{i}")
+    return backend
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_export_cache_data_json(tmp_path, encoder, pretty):
+    """Test cache data exports as a JSON array spanning several write batches."""
+    backend = make_backend(2500)
+    output = tmp_path / "cache.json"
+
+    JSONExporter.export_cache_data(backend, str(output), pretty=pretty)
+
+    records = json.loads(output.read_text())
+    assert len(records) == 2500
+    by_key = {record["key"]: record for record in records}
+    assert by_key["key0"] == {"key": "key0", "value": "value,0", "exists": True}
+    assert by_key["key1"] == {"key": "key1", "value": str({"n": 1}), "exists": True}
+    backend.close()
+
+
+def test_export_cache_data_empty_json(tmp_path, encoder):
+    """Test an empty cache exports as an empty JSON array."""
+    backend = MemoryBackend()
+    output = tmp_path / "cache.json"
+
+    JSONExporter.export_cache_data(backend, str(output))
+    JSONExporter.export_cache_data(backend, str(tmp_path / "pretty.json"), pretty=True)
+
+    assert json.loads(output.read_text()) == []
+    assert json.loads((tmp_path / "pretty.json").read_text()) == []
+    backend.close()
+
+
+def test_export_cache_data_csv(tmp_path):
+    """Test cache data exports as CSV with a header row and quoted values."""
+    backend = make_backend(1500)
+    output = tmp_path / "cache.csv"
+
+    JSONExporter.export_cache_data(backend, str(output), format="csv")
+
+    with open(output, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["key", "value", "exists"]
+    assert len(rows) == 1501
+    by_key = {row[0]: row for row in rows[1:]}
+    assert by_key["key0"] == ["key0", "value,0", "True"]
+    assert by_key["key1"] == ["key1", str({"n": 1}), "True"]
+    backend.close()
+
+
+def test_export_cache_data_rejects_unknown_format(tmp_path):
+    """Test an unsupported format raises before any file is written."""
+    backend = MemoryBackend()
+    output = tmp_path / "cache.xml"
+
+    with pytest.raises(ValueError):
+        JSONExporter.export_cache_data(backend, str(output), format="xml")
+    assert not output.exists()
+    backend.close()
+
+
+def test_export_metrics_json_and_csv(tmp_path, encoder):
+    """Test metrics export stats and every raw metric in both formats."""
+    collector = MetricsCollector()
+    collector.record("get", "key1", hit=True, latency_ms=1.5)
+    collector.record("get", "key2", hit=False, latency_ms=2.5)
+    collector.record("set", "key2", latency_ms=0.5)
+
+    JSONExporter.export_metrics(collector, str(tmp_path / "metrics.json"))
+    JSONExporter.export_metrics(collector, str(tmp_path / "metrics.csv"), format="csv")
+
+    data = json.loads((tmp_path / "metrics.json").read_text())
+    assert data["stats"]["total_operations"] == 3
+    assert data["stats"]["total_hits"] == 1
+    assert data["stats"]["operation_counts"] == {"get": 2, "set": 1}
+    assert [m["operation"] for m in data["metrics"]] == ["get", "get", "set"]
+    assert [m["key"] for m in data["metrics"]] == ["key1", "key2", "key2"]
+
+    with open(tmp_path / "metrics.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["operation", "key", "hit", "latency_ms", "timestamp"]
+    assert [row[:4] for row in rows[1:]] == [
+        ["get", "key1", "True", "1.5"],
+        ["get", "key2", "False", "2.5"],
+        ["set", "key2", "False", "0.5"],
+    ]
+
+
+def test_export_metrics_async_and_stats(tmp_path):
+    """Test the background metrics export and the stats-only export."""
+    collector = MetricsCollector()
+    collector.record("get", "key1", hit=True, latency_ms=1.0)
+
+    future = JSONExporter.export_metrics_async(collector, str(tmp_path / "metrics.json"))
+    assert future.result(timeout=5) is None
+    assert len(json.loads((tmp_path / "metrics.json").read_text())["metrics"]) == 1
+
+    JSONExporter.export_stats({"hits": 1, "ratio": 0.5}, str(tmp_path / "stats.json"))
+    assert json.loads((tmp_path / "stats.json").read_text()) == {"hits": 1, "ratio": 0.5}
@@ -0,0 +1,102 @@
+"""Unit tests for key generation and hashing."""
+
+import pytest
+
+from pycaching.utils import key_generation
+from pycaching.utils.key_generation import generate_key, hash_key
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Generate keys with orjson (when installed) and with the stdlib json fallback."""
+    if request.param == "orjson":
+        if key_generation.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(key_generation, "orjson", None)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def clear_hash_cache():
+    """Keep memoized digests from leaking between tests."""
+    key_generation._hash_cached.cache_clear()
+    yield
+    key_generation._hash_cached.cache_clear()
+
+
+def test_hash_key_default_is_pinned_blake2b():
+    """Test the default digest is BLAKE2b-128 whether or not blake3 is installed."""
+    assert hash_key("user:42") == "fdd48118d77004ffecb66c1b1e69dc3c"
+    assert hash_key(b"user:42") == "fdd48118d77004ffecb66c1b1e69dc3c"
+    assert hash_key("") == "cae66941d9efbd404e4d88758ea67670"
+    assert hash_key(42) == "755345b7ef54b0d592c17e04737ab3d9"
+
+
+def test_hash_key_default_ignores_blake3(monkeypatch):
+    """Test installing blake3 does not change default keys shared between hosts."""
+    monkeypatch.setattr(key_generation, "blake3", object())
+    assert hash_key("user:42") == "fdd48118d77004ffecb66c1b1e69dc3c"
+
+
+def test_hash_key_explicit_algorithms():
+    """Test hashlib algorithms can be chosen by name."""
+    assert hash_key("user:42", algorithm="sha256") == (
+        "ea3fd43be1e57d62e163dae19fc740bd6d660eec497235fd0ef859e2bd9fa328"
+    )
+    assert len(hash_key("user:42", algorithm="md5")) == 32
+
+
+def test_hash_key_blake3_opt_in():
+    """Test algorithm='blake3' gives a 32-character BLAKE3 digest."""
+    blake3 = pytest.importorskip("blake3")
+    expected = blake3.blake3(b"user:42").hexdigest(length=16)
+    assert hash_key("user:42", algorithm="blake3") == expected
+
+
+def test_hash_key_blake3_missing(monkeypatch):
+    """Test algorithm='blake3' without the package raises an install hint."""
+    monkeypatch.setattr(key_generation, "blake3", None)
+    with pytest.raises(ImportError, match="pip install blake3"):
+        hash_key("user:42", algorithm="blake3")
+
+
+def test_generate_key_strings():
+    """Test the all-str fast path joins arguments with the prefix."""
+    assert generate_key("user", "42") == "user:42"
+    assert generate_key("a", prefix="p") == "p:a"
+    assert generate_key("a", "b", prefix="p") == "p:a:b"
+    assert generate_key("a", "b", separator="/") == "a/b"
+    assert generate_key() == ""
+
+
+def test_generate_key_scalars(encoder):
+    """Test ints, floats, bools and bytes convert with str() or UTF-8 decoding."""
+    assert generate_key("user", 42) == "user:42"
+    assert generate_key(1.5, True, b"raw", prefix="p") == "p:1.5:True:raw"
+    assert generate_key(x=1) == "x=1"
+    assert generate_key("get", page=2, lang="en") == "get:lang=en:page=2"
+
+
+@pytest.mark.parametrize(
+    "args,kwargs,expected",
+    [
+        (({"b": 1, "a": [1, 2]},), {}, '{"a":[1,2],"b":1}'),
+        (({2: "x", 1: "y"},), {}, '{"1":"y","2":"x"}'),
+        (([1, {"z": None, "a": True}], (1, "x")), {}, '[1,{"a":true,"z":null}]:[1,"x"]'),
+        (
+            (),
+            {"filters": {"name": "é", "tags": ("a", "b")}},
+            'filters={"name":"é","tags":["a","b"]}',
+        ),
+        (([2**70],), {}, "[1180591620717411303424]"),
+    ],
+)
+def test_generate_key_containers(encoder, args, kwargs, expected):
+    """Test containers serialize to the same compact, sorted JSON with either encoder."""
+    assert generate_key(*args, **kwargs) == expected
+
+
+def test_generate_key_key_func():
+    """Test key_func replaces the built-in conversion for every argument."""
+    assert generate_key({"a": 1}, 7, key_func=lambda value: type(value).__name__) == "dict:int"
@@ -0,0 +1,114 @@
+"""Unit tests for metrics collection."""
+
+import sys
+import threading
+
+import pytest
+
+from pycaching.visualization import metrics as metrics_module
+from pycaching.visualization.metrics import MetricsCollector
+
+
+def test_latency_percentiles():
+    """Test interpolated latency percentiles, filtered by operation."""
+    collector = MetricsCollector()
+    for latency in (1.0, 2.0, 3.0, 4.0, 5.0):
+        collector.record("get", "k", hit=True, latency_ms=latency)
+    collector.record("set", "k", latency_ms=100.0)
+
+    assert collector.latency_percentiles((0, 50, 100), operation="get") == {
+        0: 1.0,
+        50: 3.0,
+        100: 5.0,
+    }
+    assert collector.latency_percentiles((75,), operation="get")[75] == pytest.approx(4.0)
+    assert collector.latency_percentiles(operation="delete") == {}
+
+
+@pytest.mark.parametrize("numpy_min_samples", [0, 10_000])
+@pytest.mark.parametrize("percentile", [-1, 100.5])
+def test_latency_percentiles_rejects_out_of_range(monkeypatch, numpy_min_samples, percentile):
+    """Test both the NumPy and pure-Python paths reject percentiles outside [0, 100]."""
+    monkeypatch.setattr(metrics_module, "_NUMPY_MIN_SAMPLES", numpy_min_samples)
+    collector = MetricsCollector()
+    collector.record("get", "k", latency_ms=1.0)
+    collector.record("get", "k", latency_ms=2.0)
+
+    with pytest.raises(ValueError):
+        collector.latency_percentiles((50, percentile))
+    with pytest.raises(ValueError):
+        MetricsCollector().latency_percentiles((percentile,))
+
+
+def test_metrics_totals_across_threads():
+    """Test counters sharded per thread add up exactly, including exited threads."""
+    collector = MetricsCollector(max_history=1000)
+    threads_count, per_thread = 8, 5000
+    barrier = threading.Barrier(threads_count)
+
+    def worker():
+        barrier.wait()
+        for i in range(per_thread):
+            collector.record("get" if i % 2 else "set", i, hit=i % 4 == 1, latency_ms=2.0)
+            if i % 1000 == 0:
+                collector.get_stats()  # Reads race with writes from other threads
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = threads_count * per_thread
+    stats = collector.get_stats()
+    assert stats["total_operations"] == total
+    assert stats["total_gets"] == total // 2
+    assert stats["total_hits"] == total // 4
+    assert stats["total_misses"] == total // 4
+    assert stats["operation_counts"] == {"get": total // 2, "set": total // 2}
+    assert stats["average_latencies_ms"] == {"get": 2.0, "set": 2.0}
+    # Raw history is bounded, unlike the counters
+    assert len(collector.get_metrics(limit=None)) == 1000
+
+    collector.clear()
+    assert collector.get_stats()["total_operations"] == 0
+    worker_after_clear = threading.Thread(target=collector.record, args=("get", "k"))
+    worker_after_clear.start()
+    worker_after_clear.join()
+    assert collector.get_stats()["total_operations"] == 1
+
+
+def test_metrics_stats_polled_while_recording_are_not_stale():
+    """Test get_stats() racing with writers never caches totals behind their stamp."""
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible so the poller lands inside a record
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            collector = MetricsCollector(max_history=10)
+            stop = threading.Event()
+
+            def poll():
+                while not stop.is_set():
+                    collector.get_stats()
+
+            def worker():
+                for i in range(2000):
+                    collector.record("get", i, hit=True, latency_ms=1.0)
+
+            poller = threading.Thread(target=poll)
+            poller.start()
+            writers = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in writers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            stop.set()
+            poller.join()
+
+            stats = collector.get_stats()
+            assert stats["total_operations"] == 8000
+            assert stats["total_hits"] == 8000
+            assert stats["average_latencies_ms"] == {"get": 1.0}
+    finally:
+        sys.setswitchinterval(interval)
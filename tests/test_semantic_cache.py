@@ -0,0 +1,144 @@
+"""Unit tests for the semantic cache."""
+
+import numpy as np
+import pytest
+
+from pycaching.llm import semantic_cache as semantic_cache_module
+from pycaching.llm.embedding import EmbeddingGenerator
+from pycaching.llm.semantic_cache import SemanticCache
+
+VOCABULARY = ["cats", "purr", "dogs", "bark", "fish", "swim", "birds", "sing", "zebra"]
+
+ITEMS = [
+    ("cats purr", "meow"),
+    ("dogs bark", "woof"),
+    ("fish swim", "blub"),
+]
+
+
+def bag_of_words(text):
+    """Deterministic custom provider: word counts over a small vocabulary."""
+    if not isinstance(text, str):
+        return np.stack([bag_of_words(txt) for txt in text])
+    words = text.split()
+    return np.array([words.count(word) for word in VOCABULARY], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    """Isolate tests from the process-wide embedding cache."""
+    EmbeddingGenerator.clear_global_cache()
+    yield
+    EmbeddingGenerator.clear_global_cache()
+
+
+def make_cache(**kwargs):
+    """Create a semantic cache backed by the bag-of-words provider."""
+    generator = EmbeddingGenerator(provider="custom", custom_provider=bag_of_words)
+    return SemanticCache(embedding_generator=generator, similarity_threshold=0.8, **kwargs)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+@pytest.mark.parametrize("use_simsimd", [True, False])
+def test_semantic_cache_dtypes(monkeypatch, dtype, use_simsimd):
+    """Test each storage dtype finds near-duplicate prompts, with and without SimSIMD."""
+    if use_simsimd and semantic_cache_module.simsimd is None:
+        pytest.skip("simsimd is not installed")
+    if not use_simsimd:
+        monkeypatch.setattr(semantic_cache_module, "simsimd", None)
+    cache = make_cache(dtype=dtype)
+    for prompt, response in ITEMS:
+        assert cache.set(prompt, response)
+
+    assert cache._matrix.dtype == np.dtype(dtype)
+    assert cache.get("cats purr") == "meow"
+    assert cache.get("dogs bark bark") == "woof"
+    assert cache.get("zebra") is None
+
+    matches = cache.find_similar("fish swim", top_k=2)
+    assert matches[0][0] == "fish swim"
+    assert matches[0][1] == pytest.approx(1.0, abs=0.02)
+    assert matches[0][2] == "blub"
+
+
+def test_semantic_cache_int8_requires_cosine():
+    """Test int8 storage is rejected for euclidean similarity."""
+    with pytest.raises(ValueError):
+        make_cache(dtype="int8", similarity_method="euclidean")
+
+
+COMBINATIONS = [
+    (dtype, index_type, method)
+    for dtype in ("float32", "float16", "int8")
+    for index_type in ("flat", "hnsw")
+    for method in ("cosine", "euclidean")
+    if not (dtype == "int8" and method == "euclidean")
+]
+
+
+@pytest.mark.parametrize("dtype,index_type,method", COMBINATIONS)
+def test_semantic_cache_index_combinations(dtype, index_type, method):
+    """Test every dtype/index/similarity combination finds exact and misses unrelated prompts."""
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    cache = make_cache(dtype=dtype, index_type=index_type, similarity_method=method)
+    cache.set_many(ITEMS)
+    cache.set("birds sing", "tweet")
+
+    assert cache.get("cats purr") == "meow"
+    assert cache.get("birds sing") == "tweet"
+    assert cache.get("zebra") is None
+    assert [match[0] for match in cache.find_similar("dogs bark", top_k=1)] == ["dogs bark"]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_semantic_cache_delete_then_search(index_type):
+    """Test deleted prompts are never matched and the moved last row is still found."""
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    cache = make_cache(index_type=index_type)
+    cache.set_many(ITEMS)
+    assert cache.get("fish swim") == "blub"  # Builds the HNSW index
+
+    # Deleting the first row moves the last row ("fish swim") into its place
+    assert cache.delete("cats purr")
+    assert cache.get("cats purr") is None
+    assert cache.get("fish swim") == "blub"
+    assert cache.get("dogs bark") == "woof"
+    assert "cats purr" not in [match[0] for match in cache.find_similar("cats purr", top_k=3)]
+
+    assert cache.delete("fish swim")
+    assert cache.delete("dogs bark")
+    assert cache.get("dogs bark") is None
+    assert cache.find_similar("dogs bark") == []
+
+    cache.set("cats purr", "meow again")
+    assert cache.get("cats purr") == "meow again"
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_semantic_cache_set_many_duplicate_keys(index_type):
+    """Test set_many with repeated prompts stores one row per prompt, last response winning."""
+    if index_type == "hnsw":
+        pytest.importorskip("faiss")
+    cache = make_cache(index_type=index_type)
+    cache.set("dogs bark", "old woof")
+    assert cache.get("dogs bark") == "old woof"  # Builds the HNSW index
+
+    count = cache.set_many(
+        [
+            ("cats purr", "meow"),
+            ("dogs bark", "woof"),
+            ("cats purr", "purr"),
+            ("fish swim", "blub"),
+        ]
+    )
+
+    assert count == 4
+    assert len(cache._keys) == 3
+    assert len(cache._key_to_row) == 3
+    assert cache.get("cats purr") == "purr"
+    assert cache.get("dogs bark") == "woof"
+    assert cache.get("fish swim") == "blub"
+    prompts = [match[0] for match in cache.find_similar("cats purr", top_k=5)]
+    assert sorted(prompts) == ["cats purr", "dogs bark", "fish swim"]
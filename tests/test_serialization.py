@@ -0,0 +1,150 @@
+"""Unit tests for cache value serializers."""
+
+import pickle
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from pycaching.core.exceptions import CacheSerializationError
+from pycaching.utils.serialization import JSONSerializer, MsgPackSerializer, PickleSerializer
+
+SAMPLE = {
+    "when": datetime(2024, 5, 1, 12, 30, 15, 250000, tzinfo=timezone.utc),
+    "blob": b"\x00\xffraw",
+    "text": "été",
+    1: "int key",
+    (2, "b"): "tuple key",
+}
+
+
+class Unpicklable:
+    """Object whose pickling fails with an error no serializer should wrap."""
+
+    def __reduce__(self):
+        raise RuntimeError("bug in __reduce__")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_serializer(request):
+    """JSONSerializer backed by orjson and by the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    return JSONSerializer(use_orjson=request.param == "orjson")
+
+
+def test_pickle_round_trip():
+    """Test pickle round-trips datetimes, bytes and non-str map keys unchanged."""
+    serializer = PickleSerializer()
+
+    assert serializer.deserialize(serializer.serialize(SAMPLE)) == SAMPLE
+
+
+def test_pickle_unserializable_value_raises_serialization_error():
+    """Test values pickle rejects raise CacheSerializationError with the cause chained."""
+    serializer = PickleSerializer()
+
+    with pytest.raises(CacheSerializationError) as exc_info:
+        serializer.serialize(threading.Lock())
+    assert isinstance(exc_info.value.__cause__, TypeError)
+
+    with pytest.raises(CacheSerializationError):
+        serializer.deserialize(b"not a pickle")
+
+
+def test_pickle_unexpected_errors_propagate():
+    """Test errors outside the pickle error set are not rewrapped."""
+    with pytest.raises(RuntimeError, match="bug in __reduce__"):
+        PickleSerializer().serialize(Unpicklable())
+
+
+def test_pickle_out_of_band_buffers():
+    """Test serialize_with_buffers keeps array data out of the stream and round-trips it."""
+    serializer = PickleSerializer()
+    array = np.arange(100_000, dtype=np.float64)
+
+    data, buffers = serializer.serialize_with_buffers({"embedding": array, "id": 7})
+
+    assert len(buffers) == 1
+    assert len(data) < 1024
+    assert all(isinstance(buffer, pickle.PickleBuffer) for buffer in buffers)
+    restored = serializer.deserialize_with_buffers(data, buffers)
+    assert restored["id"] == 7
+    np.testing.assert_array_equal(restored["embedding"], array)
+
+    with pytest.raises(CacheSerializationError):
+        serializer.deserialize_with_buffers(data, [])
+
+
+def test_json_round_trip(json_serializer):
+    """Test JSON round-trips plain values and stringifies non-str map keys."""
+    value = {"text": "été", "items": [1, 2.5, None, True], 3: "int key"}
+
+    assert json_serializer.deserialize(json_serializer.serialize(value)) == {
+        "text": "été",
+        "items": [1, 2.5, None, True],
+        "3": "int key",
+    }
+
+
+def test_json_unserializable_value_raises_serialization_error(json_serializer):
+    """Test values JSON cannot encode raise CacheSerializationError."""
+    with pytest.raises(CacheSerializationError):
+        json_serializer.serialize({"blob": b"raw", "obj": object()})
+
+    with pytest.raises(CacheSerializationError):
+        json_serializer.deserialize(b"{not json")
+
+
+def test_msgpack_round_trip():
+    """Test msgpack round-trips aware datetimes, bytes vs str and non-str map keys."""
+    pytest.importorskip("msgpack")
+    serializer = MsgPackSerializer()
+    value = {
+        "when": SAMPLE["when"],
+        "blob": SAMPLE["blob"],
+        "text": SAMPLE["text"],
+        1: "int key",
+    }
+
+    restored = serializer.deserialize(serializer.serialize(value))
+
+    assert restored == value
+    assert type(restored["blob"]) is bytes
+    assert type(restored["text"]) is str
+
+
+def test_msgpack_packer_per_thread():
+    """Test concurrent threads serialize with their own Packer."""
+    pytest.importorskip("msgpack")
+    serializer = MsgPackSerializer()
+    results = {}
+
+    def worker(n):
+        results[n] = [serializer.serialize({"n": n, "i": i}) for i in range(200)]
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for n, packed in results.items():
+        assert [serializer.deserialize(data) for data in packed] == [
+            {"n": n, "i": i} for i in range(200)
+        ]
+
+
+def test_msgpack_unserializable_value_raises_serialization_error():
+    """Test values msgpack cannot encode raise CacheSerializationError."""
+    pytest.importorskip("msgpack")
+    serializer = MsgPackSerializer()
+
+    with pytest.raises(CacheSerializationError):
+        serializer.serialize(object())
+    # The timestamp extension needs a timezone
+    with pytest.raises(CacheSerializationError):
+        serializer.serialize(datetime(2024, 5, 1))
+    with pytest.raises(CacheSerializationError):
+        serializer.deserialize(b"\xc1")
@@ -1,10 +1,26 @@
 """Unit tests for caching strategies."""
 
+import asyncio
+import logging
+import threading
+import time
+
 import pytest
 
+from pycaching.backends.async_wrapper import AsyncBackendWrapper
 from pycaching.backends.memory import MemoryBackend
+from pycaching.core.exceptions import StrategyError
+from pycaching.strategies.async_wrapper import AsyncStrategyWrapper
 from pycaching.strategies.cache_aside import CacheAsideStrategy
+from pycaching.strategies.eviction import (
+    FIFOEvictionStrategy,
+    LFUEvictionStrategy,
+    LRUEvictionStrategy,
+)
+from pycaching.strategies.refresh_ahead import RefreshAheadStrategy
 from pycaching.strategies.ttl import TTLStrategy
+from pycaching.strategies.write_back import WriteBackStrategy
+from pycaching.strategies.write_through import WriteThroughStrategy
 
 
 def test_cache_aside_strategy():
@@ -45,3 +61,303 @@ def test_ttl_strategy():
     assert backend.get("key1") is None
 
     backend.close()
+
+
+def test_lfu_eviction_strategy():
+    """Test LFU strategy evicts the least frequently used key."""
+    backend = MemoryBackend()
+    strategy = LFUEvictionStrategy(max_size=3)
+
+    for key in ("a", "b", "c"):
+        strategy.set(backend, key, key.upper())
+
+    # "a" and "c" are read; "b" is never read
+    strategy.get(backend, "a")
+    strategy.get(backend, "a")
+    strategy.get(backend, "c")
+
+    strategy.set(backend, "d", "D")
+    assert backend.get("b") is None
+    assert backend.get("a") == "A"
+
+    # "c" and "d" tie on frequency after this read; "c" was used least recently
+    strategy.get(backend, "d")
+    strategy.set(backend, "e", "E")
+    assert backend.get("c") is None
+    assert backend.get("d") == "D"
+
+    backend.close()
+
+
+def test_fifo_eviction_strategy():
+    """Test FIFO strategy skips deleted keys and keeps re-inserted keys young."""
+    backend = MemoryBackend()
+    strategy = FIFOEvictionStrategy(max_size=3)
+
+    for key in ("a", "b", "c"):
+        strategy.set(backend, key, key.upper())
+
+    # Re-inserting "a" after a delete moves it to the back of the queue
+    strategy.delete(backend, "a")
+    strategy.set(backend, "a", "A")
+    strategy.set(backend, "d", "D")
+    assert backend.get("b") is None
+    assert backend.get("a") == "A"
+
+    strategy.set(backend, "e", "E")
+    assert backend.get("c") is None
+    assert backend.get("a") == "A"
+
+    backend.close()
+
+
+def test_sharded_eviction_strategy():
+    """Test sharded LRU keeps each partition within its share of max_size."""
+    backend = MemoryBackend()
+    strategy = LRUEvictionStrategy(max_size=8, num_shards=4)
+
+    for i in range(100):
+        strategy.set(backend, f"key{i}", i)
+
+    assert backend.size() <= 8
+    assert backend.get("key99") == 99
+
+    with pytest.raises(ValueError):
+        LRUEvictionStrategy(max_size=8, num_shards=0)
+
+    backend.close()
+
+
+def test_cache_aside_single_flight():
+    """Test concurrent misses on one key invoke the miss callback once."""
+    backend = MemoryBackend()
+    strategy = CacheAsideStrategy()
+    calls = []
+    release = threading.Event()
+
+    def slow_load(key):
+        calls.append(key)
+        release.wait(timeout=5)
+        return f"loaded_{key}"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(strategy.get(backend, "k", slow_load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["k"]
+    assert results == ["loaded_k"] * 8
+    assert backend.get("k") == "loaded_k"
+
+    backend.close()
+
+
+def test_write_through_subclass_set_override():
+    """Test slotted WriteThroughStrategy keeps set() overridable and rebindable."""
+    backend = MemoryBackend()
+    store = {}
+
+    class AuditedWriteThrough(WriteThroughStrategy):
+        __slots__ = ("calls",)
+
+        def set(self, backend, key, value, ttl=None):
+            self.calls.append(key)
+            return super().set(backend, key, value, ttl)
+
+    strategy = AuditedWriteThrough()
+    strategy.calls = []
+    assert not hasattr(strategy, "__dict__")
+
+    assert strategy.set(backend, "key1", "value1")
+    strategy.write_callback = store.__setitem__
+    assert strategy.set(backend, "key2", "value2")
+
+    assert strategy.calls == ["key1", "key2"]
+    assert store == {"key2": "value2"}
+    assert backend.get("key1") == "value1"
+
+    backend.close()
+
+
+def test_refresh_ahead_refreshes_in_due_order():
+    """Test the refresh heap runs refreshes by due time, not insertion order."""
+    backend = MemoryBackend()
+    refreshed = []
+    done = threading.Event()
+
+    def refresh(key):
+        refreshed.append(key)
+        if len(refreshed) == 2:
+            done.set()
+        return None  # No new value, so nothing is rescheduled
+
+    strategy = RefreshAheadStrategy(refresh_callback=refresh, refresh_threshold=0.5)
+    strategy.set(backend, "late", "v", ttl=0.6)
+    strategy.set(backend, "early", "v", ttl=0.2)
+
+    assert done.wait(timeout=5)
+    assert refreshed == ["early", "late"]
+
+    strategy.close()
+    backend.close()
+
+
+def test_refresh_ahead_reschedules_with_new_value():
+    """Test a refreshed key gets the new value and its next refresh scheduled."""
+    backend = MemoryBackend()
+    calls = []
+
+    def refresh(key):
+        calls.append(key)
+        return f"v{len(calls)}"
+
+    strategy = RefreshAheadStrategy(refresh_callback=refresh, refresh_threshold=0.5)
+    strategy.set(backend, "key1", "v0", ttl=0.1)
+
+    deadline = time.monotonic() + 5
+    while len(calls) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) >= 3
+    assert backend.get("key1").startswith("v")
+    assert backend.get("key1") != "v0"
+
+    strategy.close()
+    backend.close()
+
+
+def test_refresh_ahead_superseded_and_deleted_refreshes_are_skipped():
+    """Test re-setting a key replaces its pending refresh and delete cancels it."""
+    backend = MemoryBackend()
+    refreshed = []
+    strategy = RefreshAheadStrategy(refresh_callback=refreshed.append, refresh_threshold=0.5)
+
+    strategy.set(backend, "reset", "v", ttl=0.1)
+    strategy.set(backend, "reset", "v", ttl=60)
+    strategy.set(backend, "deleted", "v", ttl=0.1)
+    assert strategy.delete(backend, "deleted")
+    strategy.set(backend, "marker", "v", ttl=0.2)
+
+    deadline = time.monotonic() + 5
+    while not refreshed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert refreshed == ["marker"]
+
+    strategy.close()
+    backend.close()
+
+
+def test_refresh_ahead_retries_failed_refresh(caplog):
+    """Test a refresh whose callback raises is logged and retried, not dropped."""
+    backend = MemoryBackend()
+    calls = []
+
+    def flaky_refresh(key):
+        calls.append(key)
+        if len(calls) == 1:
+            raise ConnectionError("data store unavailable")
+        return "fresh"
+
+    strategy = RefreshAheadStrategy(refresh_callback=flaky_refresh, refresh_interval=0.05)
+    with caplog.at_level(logging.ERROR, logger="pycaching.strategies.refresh_ahead"):
+        strategy.set(backend, "key1", "stale")
+        deadline = time.monotonic() + 5
+        while backend.get("key1") != "fresh" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert backend.get("key1") == "fresh"
+    assert calls[:2] == ["key1", "key1"]
+    assert caplog.records[0].exc_info[0] is ConnectionError
+
+    strategy.close()
+    backend.close()
+
+
+def test_refresh_ahead_clear_reuses_worker():
+    """Test clear() during a slow refresh never leaves two refresh workers running."""
+    backend = MemoryBackend()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_refresh(key):
+        entered.set()
+        release.wait(timeout=5)
+        return None
+
+    strategy = RefreshAheadStrategy(refresh_callback=slow_refresh, refresh_interval=0.01)
+    strategy.set(backend, "key1", "v")
+    assert entered.wait(timeout=5)
+    worker = strategy._refresh_thread
+
+    strategy.clear(backend)
+    strategy.set(backend, "key2", "v")
+    workers = [t for t in threading.enumerate() if t.name == "pycache-refresh-ahead"]
+    assert workers == [worker]
+
+    release.set()
+    strategy.close()
+    assert not worker.is_alive()
+    backend.close()
+
+
+def test_async_strategy_wrapper_context_manager_flushes_write_back():
+    """Test leaving async with closes the wrapped strategy, flushing pending write-backs."""
+    backend = MemoryBackend()
+    store = {}
+    strategy = WriteBackStrategy(
+        write_callback=store.__setitem__, batch_size=100, flush_interval=60
+    )
+
+    async def main():
+        async with AsyncStrategyWrapper(strategy, max_workers=2) as wrapper:
+            for i in range(5):
+                await wrapper.set(AsyncBackendWrapper(backend), f"k{i}", i)
+            assert store == {}
+            flusher = strategy._flusher
+        return wrapper, flusher
+
+    wrapper, flusher = asyncio.run(main())
+
+    assert store == {f"k{i}": i for i in range(5)}
+    assert not flusher.is_alive()
+    assert wrapper._executor._shutdown
+    backend.close()
+
+
+def test_async_strategy_wrapper_calls_after_close_fail_cleanly():
+    """Test calls on a closed wrapper raise StrategyError and close() is idempotent."""
+    backend = MemoryBackend()
+    closes = []
+
+    class TrackedStrategy(CacheAsideStrategy):
+        def close(self):
+            closes.append(True)
+
+    async def main():
+        wrapper = AsyncStrategyWrapper(TrackedStrategy(), max_workers=1)
+        async_backend = AsyncBackendWrapper(backend)
+        await wrapper.set(async_backend, "k", 1)
+        await wrapper.close()
+        await wrapper.close()
+
+        for call in (
+            wrapper.get(async_backend, "k"),
+            wrapper.set(async_backend, "k", 2),
+            wrapper.delete(async_backend, "k"),
+            wrapper.clear(async_backend),
+        ):
+            with pytest.raises(StrategyError, match="closed"):
+                await call
+
+    asyncio.run(main())
+
+    assert closes == [True]
+    assert backend.get("k") == 1
+    backend.close()
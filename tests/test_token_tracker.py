@@ -0,0 +1,77 @@
+"""Unit tests for token tracking."""
+
+from datetime import datetime
+
+import pytest
+
+from pycaching.llm.token_tracker import TokenTracker
+
+
+def test_get_history_limit_matches_list_slicing():
+    """Test limit selects like history[-limit:], including limit=0."""
+    tracker = TokenTracker()
+    for i in range(5):
+        tracker.record_request(i, 0)
+
+    def prompts(limit=None):
+        return [entry["prompt_tokens"] for entry in tracker.get_history(limit)]
+
+    assert prompts() == [0, 1, 2, 3, 4]
+    assert prompts(2) == [3, 4]
+    assert prompts(10) == [0, 1, 2, 3, 4]
+    assert prompts(0) == [0, 1, 2, 3, 4]
+    assert prompts(-2) == [2, 3, 4]
+
+
+def test_history_capacity_drops_oldest():
+    """Test history keeps only the newest history_capacity requests."""
+    tracker = TokenTracker(history_capacity=3)
+    for i in range(5):
+        tracker.record_request(i, 1)
+
+    assert [entry["prompt_tokens"] for entry in tracker.get_history()] == [2, 3, 4]
+    # Totals cover every request, not just the retained history
+    assert tracker.get_stats()["total_requests"] == 5
+    assert tracker.get_stats()["total_tokens"] == sum(range(5)) + 5
+
+
+def test_history_timestamps_formatted_on_read(monkeypatch):
+    """Test history stores raw timestamps and formats them as ISO strings when read."""
+    monkeypatch.setattr("pycaching.llm.token_tracker.time.time", lambda: 1_700_000_000.5)
+    tracker = TokenTracker()
+    tracker.record_request(10, 20, model="gpt")
+
+    assert tracker._history[0][0] == 1_700_000_000.5
+    entry = tracker.get_history()[0]
+    assert entry["timestamp"] == datetime.fromtimestamp(1_700_000_000.5).isoformat()
+    assert entry == {
+        "timestamp": entry["timestamp"],
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "total_tokens": 30,
+        "cost": pytest.approx(30 / 1000 * 0.002),
+        "model": "gpt",
+    }
+
+
+def test_per_model_totals():
+    """Test cost and tokens are totalled per model, skipping cache hits and unnamed models."""
+    tracker = TokenTracker()
+    tracker.record_request(500, 500, cost_per_1k_tokens=0.01, model="large")
+    tracker.record_request(1000, 0, cost_per_1k_tokens=0.002, model="small")
+    tracker.record_request(1000, 1000, cost_per_1k_tokens=0.01, model="large")
+    tracker.record_request(100, 100, model="large", cached=True)
+    tracker.record_request(1000, 0, cost_per_1k_tokens=0.002)
+
+    stats = tracker.get_stats()
+    assert stats["cost_per_model"] == {
+        "large": pytest.approx(0.03),
+        "small": pytest.approx(0.002),
+    }
+    assert stats["tokens_per_model"] == {"large": 3000, "small": 1000}
+    assert stats["total_cost"] == pytest.approx(0.034)
+    assert stats["cache_hits"] == 1
+
+    tracker.reset()
+    assert tracker.get_stats()["cost_per_model"] == {}
+    assert tracker.get_history() == []
@@ -0,0 +1,322 @@
+"""Unit tests for the write-back strategy."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from pycaching.backends.memory import MemoryBackend
+from pycaching.core.exceptions import CacheTimeoutError
+from pycaching.strategies.write_back import WriteBackStrategy
+
+
+def test_write_back_concurrent_flushes_keep_latest_value():
+    """Test an older batch cannot land after a newer one for the same key."""
+    backend = MemoryBackend()
+    store = {}
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_write(key, value):
+        if value == "old":
+            entered.set()
+            release.wait(timeout=5)
+        store[key] = value
+
+    strategy = WriteBackStrategy(write_callback=slow_write, batch_size=100, flush_interval=60)
+    strategy.set(backend, "k", "old")
+    first = threading.Thread(target=strategy.flush)
+    first.start()
+    assert entered.wait(timeout=5)
+
+    # set() must not wait for the flush in progress
+    strategy.set(backend, "k", "new")
+    second = threading.Thread(target=strategy.flush)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert store == {"k": "new"}
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_background_error_is_logged(caplog):
+    """Test a non-retryable error in the background flusher is logged, not swallowed."""
+    backend = MemoryBackend()
+    store = {}
+
+    def write(key, value):
+        if key == "bad":
+            raise ValueError("cannot encode")
+        store[key] = value
+
+    strategy = WriteBackStrategy(write_callback=write, batch_size=2, flush_interval=60)
+    with caplog.at_level(logging.ERROR, logger="pycaching.strategies.write_back"):
+        strategy.set(backend, "bad", 1)
+        strategy.set(backend, "good", 2)
+        deadline = time.monotonic() + 5
+        while not caplog.records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert store == {"good": 2}
+    assert caplog.records[0].exc_info[0] is ValueError
+    assert len(strategy._write_queue) == 0
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_max_queue_size_with_failing_store():
+    """Test a full queue rejects only the caller's write while the store keeps failing."""
+    backend = MemoryBackend()
+    attempts = []
+
+    def unavailable(key, value):
+        attempts.append(key)
+        raise ConnectionError("data store down")
+
+    strategy = WriteBackStrategy(
+        write_callback=unavailable,
+        batch_size=100,
+        flush_interval=60,
+        max_queue_size=3,
+        queue_timeout=0.2,
+    )
+    for i in range(3):
+        assert strategy.set(backend, f"k{i}", i)
+
+    with pytest.raises(CacheTimeoutError):
+        strategy.set(backend, "k3", 3)
+
+    # The retried writes stay queued, the queue stays bounded and the
+    # rejected write never reached the cache
+    assert set(attempts) <= {"k0", "k1", "k2"}
+    assert list(strategy._write_queue) == [("k0", 0), ("k1", 1), ("k2", 2)]
+    assert not backend.exists("k3")
+
+    strategy.write_callback = lambda key, value: None
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_full_queue_does_not_raise_other_keys_errors(caplog):
+    """Test set() on a full queue waits for room without raising another key's error."""
+    backend = MemoryBackend()
+    store = {}
+
+    def write(key, value):
+        if key == "bad":
+            raise ValueError("cannot encode")
+        store[key] = value
+
+    strategy = WriteBackStrategy(
+        write_callback=write, batch_size=100, flush_interval=60, max_queue_size=2
+    )
+    with caplog.at_level(logging.ERROR, logger="pycaching.strategies.write_back"):
+        strategy.set(backend, "bad", 1)
+        strategy.set(backend, "good", 2)
+        assert strategy.set(backend, "next", 3)
+
+    strategy.close()
+    assert store == {"good": 2, "next": 3}
+    backend.close()
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_write_back_background_flush_on_batch_size():
+    """Test the background thread flushes once batch_size writes are queued."""
+    backend = MemoryBackend()
+    store = {}
+    strategy = WriteBackStrategy(
+        write_callback=store.__setitem__, batch_size=3, flush_interval=60
+    )
+
+    strategy.set(backend, "k1", 1)
+    strategy.set(backend, "k2", 2)
+    time.sleep(0.05)
+    assert store == {}
+    assert backend.get("k1") == 1
+
+    strategy.set(backend, "k3", 3)
+    assert wait_for(lambda: len(store) == 3)
+    assert store == {"k1": 1, "k2": 2, "k3": 3}
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_background_flush_on_interval():
+    """Test the background thread flushes a partial batch after flush_interval."""
+    backend = MemoryBackend()
+    store = {}
+    strategy = WriteBackStrategy(
+        write_callback=store.__setitem__, batch_size=100, flush_interval=0.05
+    )
+
+    strategy.set(backend, "k1", 1)
+    assert wait_for(lambda: store == {"k1": 1})
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_retries_retryable_errors():
+    """Test writes failing with an I/O error are re-queued and written by a later flush."""
+    backend = MemoryBackend()
+    store = {}
+    failures = {"k2": 2}
+
+    def flaky_write(key, value):
+        if failures.get(key):
+            failures[key] -= 1
+            raise OSError("connection reset")
+        store[key] = value
+
+    strategy = WriteBackStrategy(write_callback=flaky_write, batch_size=100, flush_interval=60)
+    for i in range(1, 4):
+        strategy.set(backend, f"k{i}", i)
+
+    strategy.flush()
+    assert store == {"k1": 1, "k3": 3}
+    assert list(strategy._write_queue) == [("k2", 2)]
+
+    # A newer value queued before the retry wins over the failed one
+    strategy.set(backend, "k2", 20)
+    strategy.flush()
+    assert "k2" not in store
+    strategy.flush()
+    assert store == {"k1": 1, "k2": 20, "k3": 3}
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_close_flushes_and_stops_flusher():
+    """Test close() writes pending items and stops the background thread."""
+    backend = MemoryBackend()
+    store = {}
+    strategy = WriteBackStrategy(
+        write_callback=store.__setitem__, batch_size=100, flush_interval=60, max_workers=4
+    )
+    for i in range(10):
+        strategy.set(backend, f"k{i}", i)
+    flusher = strategy._flusher
+
+    strategy.close()
+
+    assert store == {f"k{i}": i for i in range(10)}
+    assert not flusher.is_alive()
+    backend.close()
+
+
+def test_write_back_bulk_write_partial_failure():
+    """Test keys reported failed by bulk_write_callback are re-queued and retried."""
+    backend = MemoryBackend()
+    store = {}
+    batches = []
+
+    def bulk_write(batch):
+        batches.append(dict(batch))
+        failed = [key for key in batch if key == "k2" and len(batches) == 1]
+        store.update((key, value) for key, value in batch.items() if key not in failed)
+        return failed
+
+    strategy = WriteBackStrategy(
+        bulk_write_callback=bulk_write, batch_size=100, flush_interval=60
+    )
+    for i in range(1, 4):
+        strategy.set(backend, f"k{i}", i)
+
+    strategy.flush()
+    assert batches == [{"k1": 1, "k2": 2, "k3": 3}]
+    assert store == {"k1": 1, "k3": 3}
+
+    strategy.flush()
+    assert batches[1] == {"k2": 2}
+    assert store == {"k1": 1, "k2": 2, "k3": 3}
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_bulk_write_retryable_error_requeues_batch():
+    """Test a retryable error from bulk_write_callback re-queues the whole batch."""
+    backend = MemoryBackend()
+    store = {}
+    calls = []
+
+    def bulk_write(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise TimeoutError("pipeline timed out")
+        store.update(batch)
+
+    strategy = WriteBackStrategy(
+        write_callback=lambda key, value: pytest.fail("bulk callback should be preferred"),
+        bulk_write_callback=bulk_write,
+        batch_size=100,
+        flush_interval=60,
+    )
+    strategy.set(backend, "k1", 1)
+    strategy.set(backend, "k2", 2)
+
+    strategy.flush()
+    assert store == {}
+    assert len(strategy._write_queue) == 2
+
+    strategy.flush()
+    assert calls == [2, 2]
+    assert store == {"k1": 1, "k2": 2}
+
+    strategy.close()
+    backend.close()
+
+
+def test_write_back_bounded_set_does_not_serialize_cache_writes():
+    """Test bounded set() calls write the cache concurrently and still respect the bound."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowBackend(MemoryBackend):
+        def set(self, key, value, ttl=None):
+            barrier.wait()  # Both writers must be inside set() at once
+            return super().set(key, value, ttl)
+
+    backend = SlowBackend()
+    strategy = WriteBackStrategy(
+        write_callback=lambda key, value: None,
+        batch_size=100,
+        flush_interval=60,
+        max_queue_size=2,
+    )
+    errors = []
+
+    def writer(key):
+        try:
+            strategy.set(backend, key, 1)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(f"k{i}",)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(strategy._write_queue) == 2
+    assert strategy._reserved == 0
+
+    strategy.close()
+    backend.close()